@@ -1,6 +1,7 @@
 import requests
 import json
 import logging
+import threading
 
 from charset_normalizer.md import Optional, List
 
@@ -9,9 +10,23 @@ class AnkiConnector:
     def __init__(self, host="127.0.0.1", port=8765):
         self.url = f"http://{host}:{port}"
         self.version = 6
+        # One keep-alive session per calling thread (see the session property)
+        self._local = threading.local()
         logging.basicConfig(level=logging.DEBUG)
         self.logger = logging.getLogger("AnkiConnector")
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        Keep-alive session for the calling thread. requests.Session is not
+        thread-safe and invoke() also runs on QThreadPool workers, so each
+        thread gets its own; pool threads keep theirs between jobs.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
     def invoke(self, action: str, **params):
         request_payload = {
             "action": action,
@@ -20,7 +35,7 @@ class AnkiConnector:
         }
         self.logger.debug(f"Invoking {action} with params: {params}")
         try:
-            response = requests.post(self.url, json=request_payload).json()
+            response = self.session.post(self.url, json=request_payload).json()
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Failed to connect to AnkiConnect: {e}")
             return None
@@ -31,8 +46,37 @@ class AnkiConnector:
 
         return response.get('result')
 
+    def invoke_multi(self, actions: List[dict]) -> Optional[list]:
+        """
+        Run several actions in one round-trip using AnkiConnect's 'multi' action.
+
+        actions: [{"action": "storeMediaFile", "params": {...}}, ...]
+
+        Returns:
+            A list with one result per action (None for an action that failed),
+            or None if the 'multi' request itself failed.
+        """
+        if not actions:
+            return []
+        actions = [{"action": a["action"], "version": self.version, "params": a.get("params", {})}
+                   for a in actions]
+        responses = self.invoke("multi", actions=actions)
+        if responses is None:
+            return None
+
+        results = []
+        for action, response in zip(actions, responses):
+            if isinstance(response, dict) and "error" in response:
+                if response["error"] is not None:
+                    self.logger.error(f"AnkiConnect error in {action['action']}: {response['error']}")
+                    results.append(None)
+                    continue
+                response = response.get("result")
+            results.append(response)
+        return results
+
     def invoke_raw(self, payload: dict):
-        response = requests.post(self.url, json=payload).json()
+        response = self.session.post(self.url, json=payload).json()
         return response
 
     def get_decks(self):
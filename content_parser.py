@@ -1,3 +1,5 @@
+import threading
+
 from sudachipy import tokenizer
 from sudachipy import dictionary
 
@@ -7,6 +9,8 @@ class ContentParser:
         # Initialize Sudachi tokenizer
         self.tokenizer_obj = dictionary.Dictionary().create()
         self.mode = tokenizer.Tokenizer.SplitMode.C
+        # The Sudachi tokenizer object must not be used from two threads at once
+        self._lock = threading.Lock()
 
     def katakana_to_hiragana(self, text):
         """
@@ -33,7 +37,8 @@ class ContentParser:
         content = "".join([c for c in content if not c.isascii()])
         content = content.strip()
 
-        tokens = self.tokenizer_obj.tokenize(content, self.mode)
+        with self._lock:
+            tokens = self.tokenizer_obj.tokenize(content, self.mode)
 
         results = []
         for m in tokens:
@@ -5,6 +5,7 @@ import html
 import sqlite3
 import subprocess
 import re
+from contextlib import contextmanager
 from typing import List, Tuple, Optional, Dict
 import logging
 
@@ -27,10 +28,44 @@ class DatabaseManager:
         self.db_path = db_path
         self._conn = sqlite3.connect(self.db_path)
         self._conn.execute("PRAGMA foreign_keys = ON;")
+        # WAL + NORMAL: a commit appends to the log instead of fsync-ing the main file
+        self._conn.execute("PRAGMA journal_mode = WAL;")
+        self._conn.execute("PRAGMA synchronous = NORMAL;")
         self.anki = anki  # store the anki object
+        self._transaction_depth = 0  # > 0 while inside transaction()
         self._create_schema()
         self._create_tables()
 
+    def commit(self):
+        """
+        Commit pending changes. Inside a transaction() block this is a no-op;
+        the block commits once when it exits.
+        """
+        if not self._transaction_depth:
+            self._conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run several DatabaseManager calls as one sqlite transaction
+        (BEGIN IMMEDIATE ... COMMIT), rolling back if the block raises.
+        Nested blocks join the outermost one.
+        """
+        if not self._transaction_depth:
+            self._conn.commit()  # nothing half-written may leak into the new transaction
+            self._conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth += 1
+        try:
+            yield self._conn
+        except BaseException:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self._conn.rollback()
+            raise
+        self._transaction_depth -= 1
+        if not self._transaction_depth:
+            self._conn.commit()
+
     def _create_schema(self):
         cur = self._conn.cursor()
 
@@ -176,7 +211,7 @@ class DatabaseManager:
         cols = [row[1] for row in cur.fetchall()]
         if 'kanji_parsed' not in cols:
             cur.execute("ALTER TABLE surface_forms ADD COLUMN kanji_parsed BOOLEAN DEFAULT 0")
-            self._conn.commit()
+            self.commit()
 
         # Linking table for surface_forms→sentences
         cur.execute("""
@@ -395,8 +430,12 @@ class DatabaseManager:
             "CREATE INDEX IF NOT EXISTS idx_surface_form_sentences_surface_form_id ON surface_form_sentences(surface_form_id)")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_surface_forms_dict_form_id ON surface_forms(dict_form_id)")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_dictionary_forms_known ON dictionary_forms(known)")
+        # Covering index for the per-sentence unknown-count subquery: the
+        # sentence's surface_form_ids come straight from the index
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sfs_sentence ON surface_form_sentences(sentence_id, surface_form_id)")
 
-        self._conn.commit()
+        self.commit()
 
     def _create_tables(self):
         # Make sure `sources` (and any other tables) exist:
@@ -413,13 +452,13 @@ class DatabaseManager:
         # """)
         # etc.
 
-        self._conn.commit()
+        self.commit()
 
     # Deck management
     def add_deck(self, deck_name: str) -> int:
         cur = self._conn.cursor()
         cur.execute("INSERT OR IGNORE INTO decks (name) VALUES (?)", (deck_name,))
-        self._conn.commit()
+        self.commit()
         cur.execute("SELECT deck_id FROM decks WHERE name = ?", (deck_name,))
         row = cur.fetchone()
         if row:
@@ -533,7 +572,7 @@ class DatabaseManager:
             cur.execute(
                 "DELETE FROM dictionary_forms WHERE dict_form_id NOT IN (SELECT dict_form_id FROM surface_forms)")
 
-            self._conn.commit()
+            self.commit()
             logger.info(f"Deleted {len(media_ids)} media, {len(text_ids)} texts, path={item_path}")
             return True
 
@@ -594,7 +633,7 @@ class DatabaseManager:
             DELETE FROM surface_form_sentences
              WHERE sentence_id = ?
         """, (sentence_id,))
-        self._conn.commit()
+        self.commit()
 
     def remove_sentences_for_text(self, text_id: int):
         """
@@ -605,7 +644,7 @@ class DatabaseManager:
             DELETE FROM sentences
              WHERE text_id = ?
         """, (text_id,))
-        self._conn.commit()
+        self.commit()
 
     def insert_sentence(self, text_id: int, content: str, start_time: float, end_time: float) -> int:
         """
@@ -616,18 +655,40 @@ class DatabaseManager:
             INSERT INTO sentences (text_id, content, start_time, end_time)
             VALUES (?, ?, ?, ?)
         """, (text_id, content, start_time, end_time))
-        self._conn.commit()
+        self.commit()
 
         # The last inserted row ID is our new sentence_id
         return cur.lastrowid
 
+    def insert_sentences(self, text_id: int, rows: List[Tuple[str, float, float]]) -> List[int]:
+        """
+        Insert many (content, start_time, end_time) rows for one text with a
+        single executemany and return their sentence_ids in input order.
+        """
+        cur = self._conn.cursor()
+        cur.executemany("""
+            INSERT INTO sentences (text_id, content, start_time, end_time)
+            VALUES (?, ?, ?, ?)
+        """, [(text_id, content, start_time, end_time) for (content, start_time, end_time) in rows])
+
+        # (text_id, content, start_time, end_time) is unique, so read the ids back by key
+        cur.execute("""
+            SELECT sentence_id, content, start_time, end_time
+              FROM sentences
+             WHERE text_id = ?
+        """, (text_id,))
+        ids = {(content, start_time, end_time): sentence_id
+               for (sentence_id, content, start_time, end_time) in cur.fetchall()}
+        self.commit()
+        return [ids[row] for row in rows]
+
     def set_text_studying(self, text_id: int, studying: bool):
         """
         Mark a specific text_id as studying (True/False).
         """
         cur = self._conn.cursor()
         cur.execute("UPDATE texts SET studying = ? WHERE text_id = ?", (1 if studying else 0, text_id))
-        self._conn.commit()
+        self.commit()
 
     def add_source_folder(self, folder_path: str) -> int:
         # Insert into a table named "sources" or something:
@@ -638,10 +699,10 @@ class DatabaseManager:
                 folder_path TEXT UNIQUE
             )
         """)
-        self._conn.commit()
+        self.commit()
 
         cur.execute("INSERT OR IGNORE INTO sources (folder_path) VALUES (?)", (folder_path,))
-        self._conn.commit()
+        self.commit()
 
         # Return the ID
         cur.execute("SELECT source_id FROM sources WHERE folder_path = ?", (folder_path,))
@@ -679,7 +740,7 @@ class DatabaseManager:
             INSERT OR IGNORE INTO subtitles (media_id, subtitle_file, language, format)
             VALUES (?, ?, ?, ?)
         """, (media_id, subtitle_file, language, format))
-        self._conn.commit()
+        self.commit()
         cur.execute("SELECT sub_id FROM subtitles WHERE subtitle_file = ?", (subtitle_file,))
         row = cur.fetchone()
         if row:
@@ -717,7 +778,7 @@ class DatabaseManager:
                 INSERT INTO sentences (text_id, content, start_time, end_time)
                 VALUES (?, ?, ?, ?)
             """, (text_id, cue.get("text", "").strip(), cue.get("start", 0.0), cue.get("end", 0.0)))
-        self._conn.commit()
+        self.commit()
 
     def get_or_create_deck(self, deck_name: str) -> int:
         deck_id = self.get_deck_id_by_name(deck_name)
@@ -812,7 +873,7 @@ class DatabaseManager:
 
         logger.info(f"Updating local DB to set deck_id={deck_id} for these cards.")
         cur.execute(f"UPDATE cards SET deck_id = ? WHERE card_id IN ({placeholders})", [deck_id] + card_ids)
-        self._conn.commit()
+        self.commit()
         logger.info(f"Local DB updated: {len(card_ids)} cards moved to deck_id={deck_id} ({deck_name}).")
 
 
@@ -872,7 +933,7 @@ class DatabaseManager:
             cur.execute("UPDATE dictionary_forms SET ranking = ? WHERE dict_form_id = ?", (rank, df_id))
             rank += 1
 
-        self._conn.commit()
+        self.commit()
 
     def get_text_comprehension(self, text_id: int) -> Optional[float]:
         """
@@ -967,14 +1028,14 @@ class DatabaseManager:
         query = f"UPDATE cards SET {col_name} = ? WHERE card_id = ?"
         cur = self._conn.cursor()
         cur.execute(query, (new_value, card_id))
-        self._conn.commit()
+        self.commit()
         logging.info(f"Local DB: updated {col_name} for card_id={card_id} to '{new_value}'")
 
     def update_card_image(self, card_id: int, new_image_html: str):
         query = "UPDATE cards SET image = ? WHERE card_id = ?"
         cur = self._conn.cursor()
         cur.execute(query, (new_image_html, card_id))
-        self._conn.commit()
+        self.commit()
         logging.info(f"Local DB: updated image for card_id={card_id} to '{new_image_html}'")
 
     def get_anki_card_id(self, local_card_id: int) -> Optional[int]:
@@ -1061,7 +1122,7 @@ class DatabaseManager:
         cur.execute(
             "INSERT INTO study_plans (order_index, text_ids, card_ids, current_day, initial_card_ids) VALUES (?, ?, ?, ?, ?)",
             (1, "", card_ids_str, 0, card_ids_str))
-        self._conn.commit()
+        self.commit()
         return cur.lastrowid
 
     def get_cards_for_study_plan_day(self, study_plan_id: int, step_number: int) -> List[int]:
@@ -1080,7 +1141,7 @@ class DatabaseManager:
     def clear_study_plan(self):
         cur = self._conn.cursor()
         cur.execute("DELETE FROM study_plans")
-        self._conn.commit()
+        self.commit()
 
     def get_current_study_plan(self) -> Optional[dict]:
         cur = self._conn.cursor()
@@ -1119,12 +1180,12 @@ class DatabaseManager:
                      VALUES (?, ?, ?)
             """, (study_plan_id, step_number, card_ids_str))
 
-        self._conn.commit()
+        self.commit()
 
     def update_study_plan_day(self, study_plan_id: int, current_day: int):
         cur = self._conn.cursor()
         cur.execute("UPDATE study_plans SET current_day = ? WHERE study_plan_id = ?", (current_day, study_plan_id))
-        self._conn.commit()
+        self.commit()
 
     def move_cards_to_study(self, card_ids: List[int]):
         if not card_ids:
@@ -1171,7 +1232,7 @@ class DatabaseManager:
 
         logger.info("Updating local DB to set deck_id=2 for these cards.")
         cur.execute(f"UPDATE cards SET deck_id = 2 WHERE card_id IN ({q_marks})", card_ids)
-        self._conn.commit()
+        self.commit()
         logger.info(f"Local DB updated: {len(card_ids)} cards moved to deck_id=2 (Study).")
 
     def simulate_review_cards(self, local_card_ids: List[int], ease_mapping: Optional[Dict[int, int]] = None) -> bool:
@@ -1293,7 +1354,7 @@ class DatabaseManager:
             FOREIGN KEY(dict_form_id) REFERENCES dictionary_forms(dict_form_id)
         );
         """)
-        self._conn.commit()
+        self.commit()
         logging.info("Appended study plan tables (including 'study_plan_day_cards') to the existing database schema.")
 
     def update_media_metadata(self, media_id: int,
@@ -1323,7 +1384,7 @@ class DatabaseManager:
                    description = ?
              WHERE media_id = ?
         """, (new_thumb, new_desc, media_id))
-        self._conn.commit()
+        self.commit()
 
     def get_cards_by_local_deck_name(self, deck_name: str) -> list:
         """
@@ -1407,6 +1468,31 @@ class DatabaseManager:
             "known": bool(row[3]),
         }
 
+    def get_dict_form_info_many(self, dict_form_ids: List[int]) -> Dict[int, dict]:
+        """
+        Batch version of get_dict_form_info(): {dict_form_id: info} for the
+        ids that exist, fetched with one IN query per 500 ids.
+        """
+        ids = list(dict.fromkeys(dict_form_ids))
+        result = {}
+        cur = self._conn.cursor()
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cur.execute(f"""
+                SELECT dict_form_id, base_form, pos, reading, known
+                  FROM dictionary_forms
+                 WHERE dict_form_id IN ({placeholders})
+            """, chunk)
+            for df_id, base_form, pos, reading, known in cur.fetchall():
+                result[df_id] = {
+                    "base_form": base_form or "",
+                    "pos": pos or "",
+                    "reading": reading or "",
+                    "known": bool(known),
+                }
+        return result
+
     def get_unknown_forms_from_cards(self, card_ids: List[int]) -> List[int]:
         unknown_set = set()
         for c_id in card_ids:
@@ -1492,7 +1578,7 @@ class DatabaseManager:
             "INSERT OR IGNORE INTO media (file_path, type, mpv_path) VALUES (?, ?, ?)",
             (file_path, media_type, mpv_path)
         )
-        self._conn.commit()
+        self.commit()
         cur.execute("SELECT media_id FROM media WHERE file_path = ?", (file_path,))
         row = cur.fetchone()
         if row:
@@ -1514,24 +1600,24 @@ class DatabaseManager:
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (deck_id, media_id, anki_card_id, deck_origin, native_word, translated_word,
               word_audio, pos, native_sentence, translated_sentence, sentence_audio, image, reading, sentence_id))
-        self._conn.commit()
+        self.commit()
         return cur.lastrowid
 
     def set_card_anki_id(self, card_id: int, anki_card_id: int):
         cur = self._conn.cursor()
         cur.execute("UPDATE cards SET anki_card_id = ? WHERE card_id = ?", (anki_card_id, card_id))
-        self._conn.commit()
+        self.commit()
 
     def update_card_tags(self, card_id: int, tags: List[str]):
         cur = self._conn.cursor()
         for t in tags:
             cur.execute("INSERT OR IGNORE INTO card_tags (card_id, tag) VALUES (?, ?)", (card_id, t))
-        self._conn.commit()
+        self.commit()
 
     def set_card_gated(self, card_id: int, gated: bool):
         cur = self._conn.cursor()
         cur.execute("UPDATE cards SET gated = ? WHERE card_id = ?", (1 if gated else 0, card_id))
-        self._conn.commit()
+        self.commit()
 
     def add_text_source(self, source_path: str, text_type: str) -> int:
         cur = self._conn.cursor()
@@ -1540,7 +1626,7 @@ class DatabaseManager:
         if row:
             return row[0]
         cur.execute("INSERT INTO texts (source, type) VALUES (?, ?)", (source_path, text_type))
-        self._conn.commit()
+        self.commit()
         return cur.lastrowid
 
     def filter_cards_by_coverage(self, candidate_card_ids: List[int], chosen_text_ids: List[int]) -> List[int]:
@@ -1602,7 +1688,7 @@ class DatabaseManager:
     def set_card_unobtainable(self, card_id: int, unobtainable: bool):
         cur = self._conn.cursor()
         cur.execute("UPDATE cards SET unobtainable = ? WHERE card_id = ?", (1 if unobtainable else 0, card_id))
-        self._conn.commit()
+        self.commit()
 
     def add_sentence_if_not_exist(self, text_id: int, sentence_str: str) -> int:
         cur = self._conn.cursor()
@@ -1611,7 +1697,7 @@ class DatabaseManager:
         if row:
             return row[0]
         cur.execute("INSERT INTO sentences (text_id, content) VALUES (?, ?)", (text_id, sentence_str))
-        self._conn.commit()
+        self.commit()
         return cur.lastrowid
 
     def get_random_sentence(self):
@@ -1644,11 +1730,43 @@ class DatabaseManager:
           JOIN dictionary_forms df        ON sf.dict_form_id = df.dict_form_id
           JOIN surface_form_sentences sfs ON sf.surface_form_id = sfs.surface_form_id
           JOIN sentences s ON sfs.sentence_id = s.sentence_id
-         WHERE s.content = ?;
+         WHERE s.content = ?
+         ORDER BY sf.surface_form_id;
         """
         cur.execute(query, (text,))
         return cur.fetchall()
 
+    def get_surface_forms_for_text_contents(self, texts: List[str]) -> Dict[str, list]:
+        """
+        Batch version of get_surface_forms_for_text_content(): {text: rows} for
+        every text in 'texts' (empty list if no sentence matches), fetched with
+        one IN query per 500 texts.
+        """
+        unique = list(dict.fromkeys(texts))
+        result = {text: [] for text in unique}
+        cur = self._conn.cursor()
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cur.execute(f"""
+                SELECT DISTINCT
+                       s.content,
+                       sf.surface_form_id,
+                       sf.surface_form,
+                       df.dict_form_id,
+                       df.base_form,
+                       df.known
+                  FROM surface_forms sf
+                  JOIN dictionary_forms df        ON sf.dict_form_id = df.dict_form_id
+                  JOIN surface_form_sentences sfs ON sf.surface_form_id = sfs.surface_form_id
+                  JOIN sentences s ON sfs.sentence_id = s.sentence_id
+                 WHERE s.content IN ({placeholders})
+                 ORDER BY s.content, sf.surface_form_id
+            """, chunk)
+            for content, *row in cur.fetchall():
+                result[content].append(tuple(row))
+        return result
+
     def get_sentences_with_all_dict_forms(self, dict_form_ids: set) -> set:
         """
         Return the set of sentence_ids that contain *all* of the given dict_form_ids.
@@ -1801,7 +1919,7 @@ class DatabaseManager:
         cur = self._conn.cursor()
         cur.execute("INSERT INTO study_plans (order_index, text_ids, card_ids) VALUES (?, ?, ?)",
                     (order_index, text_ids, card_ids))
-        self._conn.commit()
+        self.commit()
         return cur.lastrowid
 
     def add_study_plan_step(self, study_plan_id, step_number, card_sentences, text_sentences, words_covered, text_ids):
@@ -1812,13 +1930,13 @@ class DatabaseManager:
         INSERT INTO {table_name} (study_plan_id, card_sentences, text_sentences, words_covered, text_ids)
         VALUES (?, ?, ?, ?, ?)
         """, (study_plan_id, card_sentences, text_sentences, words_covered, text_ids_str))
-        self._conn.commit()
+        self.commit()
 
     def add_study_plan_word(self, study_plan_id, dict_form_id, known):
         cur = self._conn.cursor()
         cur.execute("INSERT INTO study_plan_words (study_plan_id, dict_form_id, known) VALUES (?, ?, ?)",
                     (study_plan_id, dict_form_id, 1 if known else 0))
-        self._conn.commit()
+        self.commit()
 
     def get_surface_forms_for_text(self, text_id):
         cur = self._conn.cursor()
@@ -1847,10 +1965,12 @@ class DatabaseManager:
         cur.execute(query, ids)
         return cur.fetchall()
 
-    def set_dictionary_form_known(self, dict_form_id: int, known: bool):
+    def set_dictionary_form_known(self, dict_form_id: int, known: bool, commit: bool = True):
+        """With commit=False the caller commits later (e.g. batching several toggles)."""
         cur = self._conn.cursor()
         cur.execute("UPDATE dictionary_forms SET known = ? WHERE dict_form_id = ?", (1 if known else 0, dict_form_id))
-        self._conn.commit()
+        if commit:
+            self.commit()
 
     def get_unknown_dict_forms_in_challenge_texts(self):
         cur = self._conn.cursor()
@@ -1884,9 +2004,10 @@ class DatabaseManager:
             known_count = sum(1 for f in forms if f[1] == 1)
             comprehension = (known_count / total) * 100.0
         cur.execute("UPDATE texts SET comprehension_percentage = ? WHERE text_id = ?", (comprehension, text_id))
-        self._conn.commit()
+        self.commit()
 
-    def update_unknown_counts_for_dict_form(self, dict_form_id: int):
+    def update_unknown_counts_for_dict_form(self, dict_form_id: int, commit: bool = True):
+        """Recount unknown forms of every sentence containing dict_form_id; see set_dictionary_form_known for commit."""
         cur = self._conn.cursor()
         update_query = """
         UPDATE sentences
@@ -1906,14 +2027,39 @@ class DatabaseManager:
         );
         """
         cur.execute(update_query, (dict_form_id,))
-        self._conn.commit()
+        if commit:
+            self.commit()
+
+    def update_unknown_counts_for_sentences(self, sentence_ids: List[int]):
+        """
+        Recompute unknown_dictionary_form_count for many sentences with one
+        UPDATE per 500 ids instead of one statement per sentence.
+        """
+        cur = self._conn.cursor()
+        sentence_ids = list(sentence_ids)
+        for i in range(0, len(sentence_ids), 500):
+            chunk = sentence_ids[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cur.execute(f"""
+            UPDATE sentences
+            SET unknown_dictionary_form_count = (
+                SELECT COUNT(DISTINCT df.dict_form_id)
+                FROM dictionary_forms df
+                JOIN surface_forms sf ON df.dict_form_id = sf.dict_form_id
+                JOIN surface_form_sentences sfs ON sf.surface_form_id = sfs.surface_form_id
+                WHERE sfs.sentence_id = sentences.sentence_id
+                  AND df.known = 0
+            )
+            WHERE sentence_id IN ({placeholders});
+            """, chunk)
+        self.commit()
 
     def add_target_content(self, text_id: int, priority: int, comprehension_percentage: float, text_type: str):
         cur = self._conn.cursor()
         cur.execute(
             "INSERT INTO target_content (text_id, priority, comprehension_percentage, text_type) VALUES (?, ?, ?, ?)",
             (text_id, priority, comprehension_percentage, text_type))
-        self._conn.commit()
+        self.commit()
 
     def get_or_create_dictionary_form(self, base_form: str, reading: Optional[str] = None,
                                       pos: Optional[str] = None) -> int:
@@ -1928,45 +2074,82 @@ class DatabaseManager:
             dict_form_id, current_freq = row
             new_freq = current_freq + 1
             cur.execute("UPDATE dictionary_forms SET frequency = ? WHERE dict_form_id = ?", (new_freq, dict_form_id))
-            self._conn.commit()
+            self.commit()
             return dict_form_id
         else:
             cur.execute("""
                 INSERT INTO dictionary_forms (base_form, reading, pos, frequency)
                 VALUES (?, ?, ?, ?)
             """, (base_form, reading, pos, 1))
-            self._conn.commit()
+            self.commit()
             return cur.lastrowid
 
+    def upsert_dictionary_forms(self, forms: List[Tuple[str, Optional[str], Optional[str]]]) -> List[int]:
+        """
+        Bulk version of get_or_create_dictionary_form(). Each (base_form, reading, pos)
+        occurrence adds 1 to the form's frequency, new forms are created with the
+        reading/pos of their first occurrence. Returns the dict_form_ids in input order.
+        """
+        base_forms = []
+        first_seen = {}
+        counts = {}
+        for base_form, reading, pos in forms:
+            base_form = remove_surrogates(base_form or "")
+            base_forms.append(base_form)
+            if base_form not in counts:
+                counts[base_form] = 0
+                first_seen[base_form] = (remove_surrogates(reading or ""), remove_surrogates(pos or ""))
+            counts[base_form] += 1
+
+        cur = self._conn.cursor()
+        cur.executemany("""
+            INSERT INTO dictionary_forms (base_form, reading, pos, frequency)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(base_form) DO UPDATE SET frequency = frequency + excluded.frequency
+        """, [(bf, first_seen[bf][0], first_seen[bf][1], n) for bf, n in counts.items()])
+
+        ids = {}
+        unique = list(counts)
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cur.execute(f"SELECT base_form, dict_form_id FROM dictionary_forms WHERE base_form IN ({placeholders})",
+                        chunk)
+            ids.update(cur.fetchall())
+        self.commit()
+        return [ids[bf] for bf in base_forms]
+
     def set_compound_known(self, compound_id: int, known: bool):
         cur = self._conn.cursor()
         cur.execute("UPDATE compound_forms SET known = ? WHERE compound_id = ?", (1 if known else 0, compound_id))
-        self._conn.commit()
+        self.commit()
 
     def set_compound_ranking(self, compound_id: int, ranking: Optional[int]):
         cur = self._conn.cursor()
         cur.execute("UPDATE compound_forms SET ranking = ? WHERE compound_id = ?", (ranking, compound_id))
-        self._conn.commit()
+        self.commit()
 
     def set_kanji_known(self, kanji_id: int, known: bool):
         cur = self._conn.cursor()
         cur.execute("UPDATE kanji_entries SET known = ? WHERE kanji_id = ?", (1 if known else 0, kanji_id))
-        self._conn.commit()
+        self.commit()
 
     def set_kanji_ranking(self, kanji_id: int, ranking: Optional[int]):
         cur = self._conn.cursor()
         cur.execute("UPDATE kanji_entries SET ranking = ? WHERE kanji_id = ?", (ranking, kanji_id))
-        self._conn.commit()
+        self.commit()
 
     def increment_dictionary_form_frequency(self, dict_form_id: int):
         cur = self._conn.cursor()
         cur.execute("UPDATE dictionary_forms SET frequency = frequency + 1 WHERE dict_form_id = ?", (dict_form_id,))
-        self._conn.commit()
+        self.commit()
 
-    def set_dictionary_form_known(self, dict_form_id: int, known: bool):
+    def set_dictionary_form_known(self, dict_form_id: int, known: bool, commit: bool = True):
+        """With commit=False the caller commits later (e.g. batching several toggles)."""
         cur = self._conn.cursor()
         cur.execute("UPDATE dictionary_forms SET known = ? WHERE dict_form_id = ?", (1 if known else 0, dict_form_id))
-        self._conn.commit()
+        if commit:
+            self.commit()
 
     def add_surface_form(self, dict_form_id: int, surface_form: str, reading: str, pos: Optional[str],
                          sentence_id: int, card_id: int, parse_kanji: bool = True) -> int:
@@ -1985,31 +2168,98 @@ class DatabaseManager:
             surface_form_id, current_freq = row
             new_freq = current_freq + 1
             cur.execute("UPDATE surface_forms SET frequency = ? WHERE surface_form_id = ?", (new_freq, surface_form_id))
-            self._conn.commit()
+            self.commit()
             cur.execute("INSERT INTO surface_form_sentences (surface_form_id, sentence_id) VALUES (?, ?)",
                         (surface_form_id, sentence_id))
             logging.info(f"Linking surface form to sentence: {surface_form_id}, {sentence_id}")
-            self._conn.commit()
+            self.commit()
         else:
             cur.execute("""
                 INSERT INTO surface_forms (dict_form_id, surface_form, reading, pos, frequency)
                 VALUES (?, ?, ?, ?, ?)
             """, (dict_form_id, surface_form, reading, pos, 1))
-            self._conn.commit()
+            self.commit()
             surface_form_id = cur.lastrowid
             cur.execute("INSERT INTO surface_form_sentences (surface_form_id, sentence_id) VALUES (?, ?)",
                         (surface_form_id, sentence_id))
             logging.info(f"Linking surface form to sentence: {surface_form_id}, {sentence_id}")
-            self._conn.commit()
+            self.commit()
 
         if parse_kanji and self.contains_kanji(surface_form):
             logging.info(f"Handling compound and kanji for: {surface_form}")
             self._handle_compound_and_kanji(surface_form_id, surface_form, sentence_id, card_id)
             cur.execute("UPDATE surface_forms SET kanji_parsed = 1 WHERE surface_form_id = ?", (surface_form_id,))
-            self._conn.commit()
+            self.commit()
 
         return surface_form_id
 
+    def add_surface_forms_bulk(self, rows: List[Tuple[int, str, str, Optional[str], int]],
+                               card_id: Optional[int] = None, parse_kanji: bool = False) -> List[int]:
+        """
+        Bulk version of add_surface_form() for
+        (dict_form_id, surface_form, reading, pos, sentence_id) rows.
+        Existing surface forms get their frequency bumped once per occurrence,
+        missing ones are inserted, and every row is linked to its sentence.
+        Returns the surface_form_ids in input order.
+        """
+        rows = [(df_id, remove_surrogates(sf or ""), remove_surrogates(rd or ""), remove_surrogates(pos or ""), sid)
+                for (df_id, sf, rd, pos, sid) in rows]
+        if not rows:
+            return []
+
+        counts = {}
+        for df_id, sf, rd, pos, _sid in rows:
+            key = (df_id, sf, rd, pos)
+            counts[key] = counts.get(key, 0) + 1
+
+        # Load the candidate surface forms once; a stored NULL pos matches any pos,
+        # the same as the lookup in add_surface_form().
+        cur = self._conn.cursor()
+        exact, null_pos = {}, {}
+        df_ids = list({key[0] for key in counts})
+        for i in range(0, len(df_ids), 500):
+            chunk = df_ids[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cur.execute(f"""
+                SELECT surface_form_id, dict_form_id, surface_form, reading, pos
+                  FROM surface_forms
+                 WHERE dict_form_id IN ({placeholders})
+                 ORDER BY surface_form_id
+            """, chunk)
+            for sf_id, df_id, sf, rd, pos in cur.fetchall():
+                if pos is None:
+                    null_pos.setdefault((df_id, sf, rd), sf_id)
+                else:
+                    exact.setdefault((df_id, sf, rd, pos), sf_id)
+
+        ids = {}
+        updates = []
+        for key, n in counts.items():
+            candidates = [c for c in (exact.get(key), null_pos.get(key[:3])) if c is not None]
+            if candidates:
+                ids[key] = min(candidates)
+                updates.append((n, ids[key]))
+            else:
+                cur.execute("""
+                    INSERT INTO surface_forms (dict_form_id, surface_form, reading, pos, frequency)
+                    VALUES (?, ?, ?, ?, ?)
+                """, key + (n,))
+                ids[key] = cur.lastrowid
+
+        cur.executemany("UPDATE surface_forms SET frequency = frequency + ? WHERE surface_form_id = ?", updates)
+        sf_ids = [ids[(df_id, sf, rd, pos)] for (df_id, sf, rd, pos, _sid) in rows]
+        cur.executemany("INSERT INTO surface_form_sentences (surface_form_id, sentence_id) VALUES (?, ?)",
+                        [(sf_id, row[4]) for sf_id, row in zip(sf_ids, rows)])
+
+        if parse_kanji:
+            for sf_id, (_df_id, sf, _rd, _pos, sentence_id) in zip(sf_ids, rows):
+                if self.contains_kanji(sf):
+                    self._handle_compound_and_kanji(sf_id, sf, sentence_id, card_id)
+                    cur.execute("UPDATE surface_forms SET kanji_parsed = 1 WHERE surface_form_id = ?", (sf_id,))
+
+        self.commit()
+        return sf_ids
+
     def contains_kanji(self, text: str) -> bool:
         logging.info(f"Checking for kanji")
         for char in text:
@@ -2030,13 +2280,13 @@ class DatabaseManager:
             compound_id, current_freq = row
             new_freq = current_freq + 1
             cur.execute("UPDATE compound_forms SET frequency = ? WHERE compound_id = ?", (new_freq, compound_id))
-            self._conn.commit()
+            self.commit()
         else:
             cur.execute("""
                 INSERT INTO compound_forms (surface_form_id, compound_text, frequency, known)
                 VALUES (?, ?, ?, ?)
             """, (surface_form_id, compound_text, 1, 0))
-            self._conn.commit()
+            self.commit()
             compound_id = cur.lastrowid
 
         for kchar in kanji_chars:
@@ -2047,20 +2297,20 @@ class DatabaseManager:
                 kanji_id, current_freq = row
                 new_freq = current_freq + 1
                 cur.execute("UPDATE kanji_entries SET frequency = ? WHERE kanji_id = ?", (new_freq, kanji_id))
-                self._conn.commit()
+                self.commit()
             else:
                 cur.execute("""
                     INSERT INTO kanji_entries (compound_id, kanji_char, frequency, known)
                     VALUES (?, ?, ?, ?)
                 """, (compound_id, kchar, 1, 0))
-                self._conn.commit()
+                self.commit()
                 kanji_id = cur.lastrowid
 
             cur.execute("""
                 INSERT INTO kanji_linkage (kanji_id, surface_form_id, sentence_id, card_id)
                 VALUES (?, ?, ?, ?)
             """, (kanji_id, surface_form_id, sentence_id, card_id))
-            self._conn.commit()
+            self.commit()
 
     def parse_pending_kanji(self):
         """Process surface forms that haven't had their kanji parsed yet."""
@@ -2089,7 +2339,7 @@ class DatabaseManager:
                 "UPDATE surface_forms SET kanji_parsed = 1 WHERE surface_form_id = ?",
                 (sf_id,),
             )
-        self._conn.commit()
+        self.commit()
 
     def count_deferred_kanji(self) -> int:
         """Return the number of surface forms waiting for kanji parsing."""
@@ -2103,18 +2353,18 @@ class DatabaseManager:
     def increment_surface_form_frequency(self, surface_form_id: int):
         cur = self._conn.cursor()
         cur.execute("UPDATE surface_forms SET frequency = frequency + 1 WHERE surface_form_id = ?", (surface_form_id,))
-        self._conn.commit()
+        self.commit()
 
     def set_surface_form_known(self, surface_form_id: int, known: bool):
         cur = self._conn.cursor()
         cur.execute("UPDATE surface_forms SET known = ? WHERE surface_form_id = ?",
                     (1 if known else 0, surface_form_id))
-        self._conn.commit()
+        self.commit()
 
     def get_or_create_dictionary_info(self, dictionary_name: str) -> int:
         cur = self._conn.cursor()
         cur.execute("INSERT OR IGNORE INTO dictionary_info (dictionary_name) VALUES (?)", (dictionary_name,))
-        self._conn.commit()
+        self.commit()
         cur.execute("SELECT dictionary_id FROM dictionary_info WHERE dictionary_name = ?", (dictionary_name,))
         row = cur.fetchone()
         if row:
@@ -2125,14 +2375,14 @@ class DatabaseManager:
         cur = self._conn.cursor()
         cur.execute("INSERT INTO dictionary_words (dictionary_id, lemma, pos) VALUES (?, ?, ?)",
                     (dictionary_id, lemma, pos))
-        self._conn.commit()
+        self.commit()
         return cur.lastrowid
 
     def insert_dictionary_definition(self, dictionary_word_id: int, definition: str):
         cur = self._conn.cursor()
         cur.execute("INSERT INTO dictionary_definitions (dictionary_word_id, definition) VALUES (?, ?)",
                     (dictionary_word_id, definition))
-        self._conn.commit()
+        self.commit()
 
     def import_mdx_dictionary(self, mdx_path: str, dictionary_name: str):
         script_root = os.path.dirname(__file__)
@@ -2,13 +2,36 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QStatusBar, QScrollArea, QFrame, QSpacerItem, QSizePolicy, QCheckBox
 )
-from PyQt5.QtCore import Qt, QUrl
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import Qt, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QFont, QPixmap, QPixmapCache, QImage
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 import configparser
 import os
 import re
 
+_IMAGE_WIDTH = 400  # width the card image is shown at
+
+
+class _ImageLoadSignals(QObject):
+    loaded = pyqtSignal(str, QImage)  # filename, scaled image (null if undecodable)
+
+
+class _ImageLoadJob(QRunnable):
+    """Decode and scale a card image on a QThreadPool thread (QImage, unlike QPixmap, is thread-safe)."""
+
+    def __init__(self, filename: str, full_path: str):
+        super().__init__()
+        self.filename = filename
+        self.full_path = full_path
+        self.signals = _ImageLoadSignals()
+
+    def run(self):
+        image = QImage(self.full_path)
+        if not image.isNull():
+            image = image.scaledToWidth(_IMAGE_WIDTH, Qt.SmoothTransformation)
+        self.signals.loaded.emit(self.filename, image)
+
+
 class ExploreWordsWindow(QMainWindow):
     def __init__(self, parent=None, db_manager=None, sentence_id=None, sentence_text=None):
         super().__init__(parent)
@@ -28,6 +51,9 @@ class ExploreWordsWindow(QMainWindow):
         # Audio player
         self.player = QMediaPlayer()
 
+        self._image_filename = None  # image the label should show; stale decodes are dropped
+        self._image_jobs = set()  # running _ImageLoadJobs; keeps their signals alive
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
@@ -107,6 +133,7 @@ class ExploreWordsWindow(QMainWindow):
         card_data = self.db_manager.get_card_by_sentence_id(self.sentence_id)
         if not card_data:
             # If no card found, clear
+            self._image_filename = None
             self.image_label.setText("[No Image]")
             self.current_audio_file = None
             return
@@ -140,16 +167,35 @@ class ExploreWordsWindow(QMainWindow):
                     self.status_bar.showMessage(f"Image file not found: {image_file}")
                     image_file = None
 
+        self._image_filename = image_filename if image_file else None
         if image_file:
-            pixmap = QPixmap(image_file)
-            if not pixmap.isNull():
-                scaled_pix = pixmap.scaledToWidth(400, Qt.SmoothTransformation)
-                self.image_label.setPixmap(scaled_pix)
+            pixmap = QPixmapCache.find(self._image_cache_key(image_filename))
+            if pixmap is not None:
+                self.image_label.setPixmap(pixmap)
             else:
-                self.image_label.setText("[Image not found or invalid]")
+                self.image_label.setText("Loading image...")
+                job = _ImageLoadJob(image_filename, image_file)
+                job.signals.loaded.connect(lambda name, image, j=job: self._on_image_loaded(j, name, image))
+                self._image_jobs.add(job)
+                QThreadPool.globalInstance().start(job)
         else:
             self.image_label.setText("[No Image]")
 
+    @staticmethod
+    def _image_cache_key(image_filename):
+        return f"explore:{_IMAGE_WIDTH}:{image_filename}"
+
+    def _on_image_loaded(self, job, image_filename, image):
+        self._image_jobs.discard(job)
+        if image.isNull():
+            if image_filename == self._image_filename:
+                self.image_label.setText("[Image not found or invalid]")
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._image_cache_key(image_filename), pixmap)
+        if image_filename == self._image_filename:
+            self.image_label.setPixmap(pixmap)
+
     def load_surface_forms(self):
         if not self.sentence_id:
             return
@@ -1,8 +1,12 @@
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QThread, pyqtSignal, QObject, QRunnable
+import os
 import uuid
+import threading
 import base64
 import openai
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 def generate_prompt_for_word(word: str) -> str:
@@ -10,18 +14,42 @@ def generate_prompt_for_word(word: str) -> str:
     return f"Create an illustrative image that clearly conveys the meaning of '{word}'."
 
 
+def create_http_session() -> requests.Session:
+    """Keep-alive session for image downloads, with a small retry budget."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_thread_sessions = threading.local()
+
+
+def thread_http_session() -> requests.Session:
+    """create_http_session() for the calling thread; pool threads keep theirs between tasks."""
+    session = getattr(_thread_sessions, "session", None)
+    if session is None:
+        session = _thread_sessions.session = create_http_session()
+    return session
+
+
 class ImageGenerationThread(QThread):
     """Worker thread that generates an image using OpenAI and stores it via AnkiConnect."""
 
     done = pyqtSignal(int, str)  # dict_form_id, filename
     error = pyqtSignal(str)
 
-    def __init__(self, word_text: str, dict_form_id: int, api_key: str, anki_connector):
+    def __init__(self, word_text: str, dict_form_id: int, api_key: str, anki_connector, session=None):
         super().__init__()
         self.word = word_text
         self.dict_form_id = dict_form_id
         self.api_key = api_key
         self.anki = anki_connector
+        # Shared requests.Session (see create_http_session); falls back to one-shot requests.get
+        self.session = session or requests
+        self.image_data = None  # downloaded bytes, kept so the UI can build a preview without re-reading
 
     def run(self):
         openai.api_key = self.api_key
@@ -32,19 +60,95 @@ class ImageGenerationThread(QThread):
             if not response.get("data") or "url" not in response["data"][0]:
                 raise ValueError(f"Unexpected response format: {response}")
             image_url = response["data"][0]["url"]
-            image_data = requests.get(image_url).content
         except Exception as e:
             self.error.emit(f"Image generation failed: {e}")
             return
 
         filename = f"ai_image_{uuid.uuid4().hex}.png"
+
+        # Let Anki fetch the image itself; only download and base64 it here
+        # if Anki could not reach the URL.
+        res = self.anki.invoke("storeMediaFile", filename=filename, url=image_url)
+        if res is None:
+            try:
+                # A stalled download would otherwise hold up the whole generation queue
+                image_data = self.session.get(image_url, timeout=30).content
+            except Exception as e:
+                self.error.emit(f"Image generation failed: {e}")
+                return
+
+            try:
+                b64_data = base64.b64encode(image_data).decode("utf-8")
+                res = self.anki.invoke("storeMediaFile", filename=filename, data=b64_data)
+                if res is None:
+                    raise Exception("Anki storeMediaFile failed")
+            except Exception as e:
+                self.error.emit(f"Failed saving image: {e}")
+                return
+            self.image_data = image_data
+
+        self.done.emit(self.dict_form_id, filename)
+
+
+class ImageGenSignals(QObject):
+    finished = pyqtSignal(str, bytes)  # word, image bytes
+    error = pyqtSignal(str, str)  # word, message
+
+
+class ImageGenTask(QRunnable):
+    """
+    Generate one image for ``word`` from ``prompt`` on a QThreadPool thread.
+
+    With a cache_path, an image already generated there is read back instead
+    of calling OpenAI again, and a new one is written there before it is emitted.
+    """
+
+    def __init__(self, word: str, prompt: str, api_key: str, model: str = "dall-e-3",
+                 cache_path: str = None, session=None):
+        super().__init__()
+        self.word = word
+        self.prompt = prompt
+        self.api_key = api_key
+        self.model = model
+        self.cache_path = cache_path
+        # Several tasks run at once and requests.Session is not thread-safe, so
+        # by default run() uses the pool thread's own session (thread_http_session)
+        self.session = session
+        self.signals = ImageGenSignals()
+
+    def run(self):
         try:
-            b64_data = base64.b64encode(image_data).decode("utf-8")
-            res = self.anki.invoke("storeMediaFile", filename=filename, data=b64_data)
-            if res is None:
-                raise Exception("Anki storeMediaFile failed")
+            if self.cache_path and os.path.exists(self.cache_path):
+                with open(self.cache_path, "rb") as f:
+                    self.signals.finished.emit(self.word, f.read())
+                return
+
+            openai.api_key = self.api_key
+            response = openai.Image.create(
+                prompt=self.prompt,
+                n=1,
+                size="1024x1024",
+                model=self.model,
+            )
+            # handle either URL or base64-encoded image
+            item = response.get("data", [{}])[0]
+            if "url" in item:
+                session = self.session or thread_http_session()
+                resp = session.get(item["url"], stream=True, timeout=30)
+                resp.raise_for_status()  # never cache an error page as the image
+                image_data = resp.content
+            elif "b64_json" in item:
+                image_data = base64.b64decode(item["b64_json"])
+            else:
+                raise ValueError(f"Unexpected image response format: {item}")
+
+            if self.cache_path:
+                # Write then rename so a crash never leaves a truncated cache entry
+                tmp_path = self.cache_path + ".part"
+                with open(tmp_path, "wb") as f:
+                    f.write(image_data)
+                os.replace(tmp_path, self.cache_path)
         except Exception as e:
-            self.error.emit(f"Failed saving image: {e}")
+            self.signals.error.emit(self.word, str(e))
             return
-
-        self.done.emit(self.dict_form_id, filename)
+        self.signals.finished.emit(self.word, image_data)
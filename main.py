@@ -35,8 +35,8 @@ except ImportError as e:
     print("Failed to import mpv:", e)
     sys.exit(1)
 
-from PyQt5.QtCore import Qt, QUrl, QTimer, pyqtSignal
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import Qt, QUrl, QTimer, pyqtSignal, QThreadPool
+from PyQt5.QtGui import QFont, QPixmap, QPixmapCache
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 from PyQt5.QtWidgets import (
     QApplication,
@@ -3666,7 +3666,10 @@ class CentralHub(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
-
+    # Room for the scaled card images the windows keep in QPixmapCache (KB)
+    QPixmapCache.setCacheLimit(50 * 1024)
+    # Image decodes, Anki uploads and image generation all share the global pool
+    QThreadPool.globalInstance().setMaxThreadCount(4)
 
 
     from anki_connector import AnkiConnector
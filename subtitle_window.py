@@ -1,15 +1,26 @@
 import base64
+import hashlib
+import json
 import logging
 import os
+import re
+import tempfile
+import time
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 
 import openai
-from google.auth.transport import requests
 
 from content_parser import ContentParser
-from PyQt5.QtGui import QPalette, QColor
-from PyQt5.QtCore import pyqtSignal, Qt, QThread
+from PyQt5.QtGui import QPalette, QColor, QPixmap, QImage
+from PyQt5.QtCore import (
+    pyqtSignal, Qt, QThread, QAbstractListModel, QModelIndex, QSize, QObject, QRunnable, QThreadPool, QProcess,
+    QCoreApplication
+)
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QListWidget, QListWidgetItem,
@@ -17,7 +28,7 @@ from PyQt5.QtWidgets import (
     QCheckBox, QWidget, QSizePolicy, QToolBar, QAction, QMessageBox,
     QStackedWidget, QLineEdit, QPushButton, QFormLayout, QGroupBox,
     QHBoxLayout, QPlainTextEdit, QSpacerItem, QComboBox, QToolButton, QWidgetAction, QButtonGroup, QRadioButton,
-    QInputDialog, QMenu, QTabWidget, QFrame
+    QInputDialog, QMenu, QTabWidget, QFrame, QListView
 
 )
 
@@ -29,9 +40,238 @@ from PyQt5.QtWidgets import (
 )
 
 from PyQt5.QtCore import QTimer, Qt
-from image_generation_thread import ImageGenerationThread
+from image_generation_thread import ImageGenerationThread, ImageGenTask, create_http_session
 from PyQt5.QtCore import QTimer, Qt, pyqtSignal
 
+# Image previews on the Anki editor's Images tab
+_THUMB_SIZE = 200
+_THUMB_MAX = 128  # decoded previews kept in SubtitleWindow._thumb_cache
+_THUMB_PENDING = object()  # returned by SubtitleWindow._get_thumbnail while a decode job runs
+
+_DECK_SYNC_TTL = 30.0  # seconds a deck list fetched from Anki is considered fresh
+
+# Source audio codecs that are cut with "-c:a copy", and the extension of the snippet
+_AUDIO_STREAM_COPY_EXT = {"mp3": ".mp3", "aac": ".m4a"}
+
+# Prompt for word images; filled with str.format(word=..., sentence=...)
+_WORD_IMAGE_PROMPT = (
+    "Context:\n"
+    "Below is a sentence that uses the word \"{word}\":\n"
+    "\"{sentence}\"\n\n"
+    "Character & Scene:\n"
+    "Akio – a young woman with ginger wavy hair, amber-hazel eyes, sun-kissed skin, and an athletic build – wearing a modern-meets-traditional Japanese outfit. She is energetic and expressive, captured mid-action as the central focus.\n\n"
+    "Task:\n"
+    "Illustrate the meaning of \"{word}\" through Akio’s actions, expression, and the scene around her, without any text or writing in the image. Use visual context and symbolism so that the viewer can infer the word’s sense from the image alone. If the concept of \"{word}\" is abstract or sensitive, portray it metaphorically in a positive, safe manner (no graphic or disallowed content).\n\n"
+    "Art Style & Lighting:\n\n"
+    "A blend of minimalist and detailed photorealistic elements with high-quality anime aesthetics\n\n"
+    "Soft two-tone anime-style shading and romantic natural lighting (warm sunset or gentle morning glow) to create an uplifting, joyful mood\n\n"
+    "2.5D perspective for depth and dimensionality\n\n"
+    "Consistency:\n"
+    "Ensure Akio remains consistent in appearance across images, and that the overall scene clearly symbolizes \"{word}\" at a glance."
+)
+
+@lru_cache(maxsize=512)
+def _word_image_filename(word: str, prompt: str) -> str:
+    """Media filename of the generated image for (word, prompt); doubles as its cache key."""
+    key = hashlib.blake2b(f"{word}|{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+    return f"word_image_{key}.png"
+
+_SOUND_TAG_RE = re.compile(r'\[sound:(.*?)\]')  # Anki [sound:filename] tags
+
+# Kept as one constant string so sqlite3's statement cache reuses the prepared statement
+_UPDATE_UNKNOWN_COUNT_SQL = """
+UPDATE sentences
+SET unknown_dictionary_form_count = (
+    SELECT COUNT(DISTINCT df.dict_form_id)
+    FROM dictionary_forms df
+    JOIN surface_forms sf ON df.dict_form_id = sf.dict_form_id
+    JOIN surface_form_sentences sfs ON sf.surface_form_id = sfs.surface_form_id
+    WHERE sfs.sentence_id = sentences.sentence_id
+      AND df.known = 0
+)
+WHERE sentence_id = ?;
+"""
+
+
+def _extract_img_srcs(text: str) -> list:
+    r"""
+    Return the src of every <img src="..."> tag in text, in order.
+
+    Matches exactly what r'<img\s+src="([^"]+)">' did, but scans with
+    str.find, since this runs on every edit of the Images field.
+    """
+    srcs = []
+    n = len(text)
+    i = text.find("<img")
+    while i != -1:
+        k = i + 4
+        while k < n and text[k].isspace():
+            k += 1
+        if k > i + 4 and text.startswith('src="', k):
+            start = k + 5
+            end = text.find('"', start)
+            if end > start and text.startswith(">", end + 1):
+                srcs.append(text[start:end])
+                i = text.find("<img", end + 2)
+                continue
+        i = text.find("<img", i + 1)
+    return srcs
+
+
+@dataclass(slots=True)
+class SubLine:
+    """One editable subtitle line (times in seconds)."""
+    start: float
+    end: float
+    text: str
+
+
+class _ImageDecodeSignals(QObject):
+    decoded = pyqtSignal(str, float, QImage)  # filename, mtime, scaled image (null if undecodable)
+
+
+class _ImageDecodeJob(QRunnable):
+    """Decode and scale one media file on a QThreadPool thread (QImage, unlike QPixmap, is thread-safe)."""
+
+    def __init__(self, filename: str, full_path: str, mtime: float):
+        super().__init__()
+        self.filename = filename
+        self.full_path = full_path
+        self.mtime = mtime
+        self.signals = _ImageDecodeSignals()
+
+    def run(self):
+        image = QImage(self.full_path)
+        if not image.isNull():
+            image = image.scaled(_THUMB_SIZE, _THUMB_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.decoded.emit(self.filename, self.mtime, image)
+
+
+class _MediaStoreSignals(QObject):
+    stored = pyqtSignal(str, object)  # filename, storeMediaFile result (None on failure)
+
+
+class _MediaStoreJob(QRunnable):
+    """
+    Read a file and store it base64-encoded (data=) in Anki's media collection
+    on a QThreadPool thread. Fallback for when Anki cannot read the file
+    itself through storeMediaFile's path= (e.g. when Anki runs elsewhere).
+    """
+
+    def __init__(self, anki, filename: str, path: str):
+        super().__init__()
+        self.anki = anki
+        self.filename = filename
+        self.path = path
+        self.signals = _MediaStoreSignals()
+
+    def run(self):
+        try:
+            with open(self.path, "rb") as f:
+                b64_data = base64.b64encode(f.read()).decode("utf-8")
+            res = self.anki.invoke("storeMediaFile", filename=self.filename, data=b64_data)
+        except Exception:
+            logger.exception("Storing %s in Anki failed", self.filename)
+            res = None
+        self.signals.stored.emit(self.filename, res)
+
+
+class _AnkiBatchSignals(QObject):
+    done = pyqtSignal(object)  # one result per action, or None if the request failed
+
+
+class _AnkiBatchJob(QRunnable):
+    """Send queued AnkiConnect actions as one 'multi' request on a QThreadPool thread."""
+
+    def __init__(self, anki, actions):
+        super().__init__()
+        self.anki = anki
+        self.actions = actions
+        self.signals = _AnkiBatchSignals()
+
+    def run(self):
+        try:
+            results = self.anki.invoke_multi(self.actions)
+        except Exception:
+            logger.exception("AnkiConnect batch of %d actions failed", len(self.actions))
+            results = None
+        self.signals.done.emit(results)
+
+
+class ImagePreviewModel(QAbstractListModel):
+    """
+    Filenames of the <img> tags on the card being edited. Previews are only
+    decoded when a view asks for a row's decoration, i.e. when it is visible.
+    """
+
+    def __init__(self, thumbnail_provider, parent=None):
+        super().__init__(parent)
+        # callable(filename, mtime) -> QPixmap (null if undecodable), _THUMB_PENDING, or None if missing
+        self._thumbnail = thumbnail_provider
+        self._filenames = []
+        self._mtimes = {}  # filename -> mtime stat'ed at the last set_filenames(), None if missing
+        # Shown while a preview is still being decoded, so the strip does not jump
+        self._placeholder = QPixmap(_THUMB_SIZE, _THUMB_SIZE)
+        self._placeholder.fill(QColor("lightgray"))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._filenames)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        filename = self._filenames[index.row()]
+        if role == Qt.DecorationRole:
+            pixmap = self._thumbnail(filename, self._mtimes.get(filename))
+            if pixmap is _THUMB_PENDING:
+                return self._placeholder
+            if pixmap is not None and not pixmap.isNull():
+                return pixmap
+        elif role == Qt.DisplayRole:
+            pixmap = self._thumbnail(filename, self._mtimes.get(filename))
+            if pixmap is None:
+                return f"Missing file:\n{filename}"
+            if pixmap is not _THUMB_PENDING and pixmap.isNull():
+                return f"Invalid image data: {filename}"
+        elif role == Qt.ToolTipRole:
+            return filename
+        return None
+
+    def refresh_filename(self, filename):
+        """Tell views that the preview for `filename` is available."""
+        for row, name in enumerate(self._filenames):
+            if name == filename:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def set_filenames(self, filenames, mtimes):
+        """
+        Replace the list with a minimal diff: rows in the common prefix are
+        kept (so views keep their painted items), only the differing tail is
+        removed and re-inserted. Appending one <img> tag inserts one row.
+        `mtimes` maps each filename to its mtime, or None if it is missing.
+        Kept rows are still re-queried, so a file that was missing and has
+        since appeared in the media folder replaces its "Missing file" label.
+        """
+        self._mtimes = mtimes
+        new = list(filenames)
+        old = self._filenames
+        k = 0
+        while k < len(old) and k < len(new) and old[k] == new[k]:
+            k += 1
+
+        if k:
+            self.dataChanged.emit(self.index(0), self.index(k - 1))
+
+        if k < len(old):
+            self.beginRemoveRows(QModelIndex(), k, len(old) - 1)
+            del self._filenames[k:]
+            self.endRemoveRows()
+        if k < len(new):
+            self.beginInsertRows(QModelIndex(), k, len(new) - 1)
+            self._filenames.extend(new[k:])
+            self.endInsertRows()
+
 
 class ClickableWordLabel(QLabel):
     """Small QLabel subclass that emits a signal when clicked."""
@@ -48,40 +288,19 @@ class ClickableWordLabel(QLabel):
 
 
 
-class WordImageWorker(QThread):
-    """Background worker to generate a word image via OpenAI."""
-    finished = pyqtSignal(bytes)
+class TokenizeWorker(QThread):
+    """Background worker that runs ContentParser.parse_content over a list of texts."""
+    done = pyqtSignal(list)  # one token list per input text
     error = pyqtSignal(str)
 
-    def __init__(self, api_key: str, prompt: str, model: str = "dall-e-3", parent: Optional[QWidget] = None):
+    def __init__(self, parser: ContentParser, texts, parent: Optional[QWidget] = None):
         super().__init__(parent)
-        self.api_key = api_key
-        self.prompt = prompt
-        self.model = model
+        self.parser = parser
+        self.texts = list(texts)
 
     def run(self):
-        import openai
-        import requests
-
         try:
-            openai.api_key = self.api_key
-            # call GPT-Image-1 (default response_format is URL)
-            response = openai.Image.create(
-                prompt=self.prompt,
-                n=1,
-                size="1024x1024",
-                model=self.model,
-            )
-            # handle either URL or base64-encoded image
-            item = response.get("data", [{}])[0]
-            if "url" in item:
-                image_data = requests.get(item["url"]).content
-            elif "b64_json" in item:
-                import base64
-                image_data = base64.b64decode(item["b64_json"])
-            else:
-                raise ValueError(f"Unexpected image response format: {item}")
-            self.finished.emit(image_data)
+            self.done.emit([self.parser.parse_content(text) for text in self.texts])
         except Exception as e:
             self.error.emit(str(e))
 
@@ -265,10 +484,26 @@ class SubtitleWindow(QDialog):
         self.google_credentials = google_credentials
         self.anki_media_path = anki_media_path
         self.audio_player = audio_player
+        self._sentence_playlist = None  # QMediaPlaylist used by play_sentence_audio_all
+        # sha1(text|language|gender) -> media filename of word audio already synthesized
+        self._tts_cache_path = (os.path.join(anki_media_path, ".tts_cache.json")
+                                if anki_media_path else None)
+        self._tts_cache = self._load_tts_cache()
+        self._tts_client = None  # texttospeech.TextToSpeechClient, created on first use
+        self._tts_voice = None
+        self._tts_audio_config = None
         self.openai_api_key = openai_api_key
         self.tmdb_api_key = tmdb_api_key
-        self.parser = ContentParser()
+        self._parser = None  # ContentParser, created on first use (see _content_parser)
+        self._parse_workers = []  # TokenizeWorkers started by _parse_in_background
+        # Native sentence -> tokens parsed ahead of time while the card editor sat idle
+        self._pending_tokens = {}
+        self._pretokenize_inflight = set()
         self._subtitle_lines = []
+        # (content, start_ms, end_ms) -> text_id, built lazily from 'sentences'
+        self._sentences_index = None
+        self._save_worker = None  # TokenizeWorker for the pending "Save Changes"
+        self._video_path_cache = {}  # text_id -> media file_path, see get_current_video_path
 
         # Keep references to certain UI items so we can update them
         self.subtitle_editor_rows = []  # will hold row widgets for editor
@@ -278,10 +513,39 @@ class SubtitleWindow(QDialog):
         # Maintain the order of dictionary form IDs for the current sentence
         # so selected words appear in sentence order
         self.anki_sentence_df_order = []
+        # sentence_id -> surface-form rows shown in the Anki editor grid, LRU order
+        self._anki_forms_cache = OrderedDict()
+        self._dict_form_info_cache = {}  # dict_form_id -> get_dict_form_info() dict
+        # subtitle text -> surface-form rows shown in the Word Viewer, LRU order
+        self._text_forms_cache = OrderedDict()
+        # Anki editor word grid: pooled (word QLabel, reading QLabel, QCheckBox) columns
+        self._anki_row_pool = []
+        self._anki_row_words = []  # (dict_form_id, surface) shown in each pooled column
+        self._anki_select_label = None
+        self._anki_empty_label = None
         self.current_font_size = 10  # Default font size
         self._image_queue = []  # background image generation tasks
+        self._last_deck_sync_ts = 0.0  # time.monotonic() of the last successful sync_anki()
+        self._cached_deck_names = []
+        self._http_session = create_http_session()  # ImageGenerationThread queue; one download at a time
+        # (filename, mtime) -> QPixmap already scaled for the Images tab, LRU order
+        self._thumb_cache = OrderedDict()
+        self._displayed_images = []  # filenames currently shown on the Images tab
+        self._thumb_jobs = {}  # (filename, mtime) -> _ImageDecodeJob still running
+        self._ffmpeg_procs = []  # running QProcess objects (kept referenced until finished)
+        self._audio_codec_cache = {}  # media file -> ffprobe codec_name of its first audio stream
+        self._media_jobs = set()  # _MediaStoreJob uploads still running
+        # filenames in anki_media_path, re-read when the folder's mtime changes
+        self._media_snapshot = set()
+        self._media_snapshot_mtime = None
         self._current_worker = None
-        self.word_image_workers = []  # track multiple WordImageWorker instances
+        self.word_image_workers = []  # ImageGenTasks still running; keeps their signals alive
+        # ImageGenTasks block on OpenAI and a download for seconds; keep them off the
+        # global pool so thumbnail decodes and Anki uploads are not queued behind them
+        self._image_gen_pool = QThreadPool(self)
+        self._image_gen_pool.setMaxThreadCount(2)
+        # image filename -> [(on_finished, on_error)] waiting on the task generating it
+        self._word_image_inflight = {}
 
         self.selected_word_id = None
         self.selected_word_text = ""
@@ -291,8 +555,30 @@ class SubtitleWindow(QDialog):
         self.word_viewer_selected_dict_form_ids = set()
         self.word_viewer_selected_dict_form_surfaces = {}
         self.word_viewer_dict_form_surfaces = {}
+        # Word viewer strip: pooled (container, ClickableWordLabel, base QLabel, QCheckBox) rows
+        self._word_row_pool = []
+        self._word_row_active = 0  # rows of the pool shown for the current subtitle
+        self._word_row_surfaces = []  # (dict_form_id, surface) shown in each pooled row
+        self._word_viewer_empty_label = None
         self.word_image_files_map = {}
 
+        # Deferred DB commit (see _schedule_commit); flushed on close/quit as well
+        self._commit_pending = False
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(150)
+        self._commit_timer.timeout.connect(self._flush_commit)
+        # AnkiConnect actions waiting to be sent as one 'multi' request (see _queue_anki)
+        self._anki_pending = {}  # (action, params json) -> (action dict, [on_result callbacks])
+        self._anki_batch_jobs = set()
+        self._anki_flush_timer = QTimer(self)
+        self._anki_flush_timer.setSingleShot(True)
+        self._anki_flush_timer.setInterval(200)
+        self._anki_flush_timer.timeout.connect(self._flush_anki)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_commit)
+
 
         self.setWindowFlags(
             Qt.Window |
@@ -622,8 +908,8 @@ class SubtitleWindow(QDialog):
 
         self.subtitle_editor_rows.clear()
 
-        for idx, (start_sec, end_sec, text) in enumerate(self._subtitle_lines):
-            row_widget = self.build_subtitle_editor_row(idx, start_sec, end_sec, text)
+        for idx, line in enumerate(self._subtitle_lines):
+            row_widget = self.build_subtitle_editor_row(idx, line.start, line.end, line.text)
             self.editor_layout.addWidget(row_widget)
             self.subtitle_editor_rows.append(row_widget)
 
@@ -731,17 +1017,15 @@ class SubtitleWindow(QDialog):
         self.adjust_subtitle_time(index, is_start, delta)
 
         # Now update our loop range so the timer sees the *new* times.
-        start_sec, end_sec, _ = self._subtitle_lines[index]
-        self._current_subtitle_start = start_sec
-        self._current_subtitle_end = end_sec
+        line = self._subtitle_lines[index]
+        self._current_subtitle_start = line.start
+        self._current_subtitle_end = line.end
 
     def on_subtitle_text_changed(self, index, new_text):
         """
         If you allow direct text editing in the editor, store changes back to _subtitle_lines.
         """
-        # _subtitle_lines[index] is (start, end, text)
-        start_sec, end_sec, _ = self._subtitle_lines[index]
-        self._subtitle_lines[index] = (start_sec, end_sec, new_text)
+        self._subtitle_lines[index].text = new_text
 
     def on_subtitle_radio_clicked(self, button_id: int):
         """
@@ -751,7 +1035,8 @@ class SubtitleWindow(QDialog):
         if button_id < 0 or button_id >= len(self._subtitle_lines):
             return
 
-        start_sec, end_sec, _ = self._subtitle_lines[button_id]
+        line = self._subtitle_lines[button_id]
+        start_sec, end_sec = line.start, line.end
 
         # Grab mpv from the parent window
         main_window = self.parent()
@@ -833,8 +1118,76 @@ class SubtitleWindow(QDialog):
                                 "Please store text_id or provide one manually.")
             return
 
+        # 5) Tokenize in the background; the DB writes happen back on the UI thread
+        #    (the sqlite connection belongs to it) once all lines are parsed.
+        lines = [SubLine(line.start, line.end, line.text) for line in self._subtitle_lines]
+        self.action_save_changes.setEnabled(False)
+        self._save_worker = TokenizeWorker(self._content_parser(), [line.text for line in lines], parent=self)
+        self._save_worker.done.connect(lambda tokens: self._write_saved_subtitles(text_id, lines, tokens))
+        self._save_worker.error.connect(self._on_save_tokenize_error)
+        self._save_worker.finished.connect(lambda: self.action_save_changes.setEnabled(True))
+        self._save_worker.start()
+
+    def _content_parser(self) -> ContentParser:
+        """Return the shared ContentParser, loading the Sudachi dictionary on first use."""
+        if self._parser is None:
+            self._parser = ContentParser()
+        return self._parser
+
+    def _parse_in_background(self, text, on_tokens, on_error=None):
+        """Tokenize `text` on a TokenizeWorker and call on_tokens(tokens) back on the UI thread."""
+        if on_error is None:
+            def on_error(message):
+                QMessageBox.critical(self, "Parse Failed", f"Could not parse the sentence:\n{message}")
+
+        worker = TokenizeWorker(self._content_parser(), [text], parent=self)
+        worker.done.connect(lambda results: on_tokens(results[0]))
+        worker.error.connect(on_error)
+        worker.finished.connect(lambda: self._parse_workers.remove(worker))
+        self._parse_workers.append(worker)
+        worker.start()
+
+    def _with_tokens(self, text, on_tokens):
+        """Call on_tokens with the tokens of `text`, reusing a pre-parsed result if there is one."""
+        tokens = self._pending_tokens.pop(text, None)
+        if tokens is not None:
+            on_tokens(tokens)
+        else:
+            self._parse_in_background(text, on_tokens)
+
+    def _schedule_bg_parse(self):
+        """
+        Runs once the Native Sentence field has been idle for 300 ms: parse it
+        in the background so that "Add Card" finds the tokens ready.
+        """
+        text = self.field_native_sentence.toPlainText().strip()
+        if not text or text in self._pending_tokens or text in self._pretokenize_inflight:
+            return
+
+        def store(tokens):
+            self._pretokenize_inflight.discard(text)
+            self._pending_tokens[text] = tokens
+            while len(self._pending_tokens) > 8:  # only the latest few edits are worth keeping
+                self._pending_tokens.pop(next(iter(self._pending_tokens)))
+
+        def failed(message):
+            self._pretokenize_inflight.discard(text)
+            logger.warning("Background parse of the native sentence failed: %s", message)
+
+        self._pretokenize_inflight.add(text)
+        self._parse_in_background(text, store, on_error=failed)
+
+    def _on_save_tokenize_error(self, message):
+        logger.error("Error tokenizing subtitles: %s", message)
+        QMessageBox.critical(self, "Save Failed", f"An error occurred:\n{message}")
+
+    def _write_saved_subtitles(self, text_id, lines, tokens_per_line):
+        """
+        Replace the stored sentences of text_id with `lines`, using the token
+        lists produced by the TokenizeWorker (one list per line).
+        """
         try:
-            with self.db_manager._conn:
+            with self.db_manager.transaction():
                 # 1) Retrieve the old sentence IDs for this text
                 old_sentences = self.get_sentences_for_text_id(text_id)
                 # each = (sentence_id, content, start_time, end_time)
@@ -854,30 +1207,31 @@ class SubtitleWindow(QDialog):
                 # 3) Remove the old sentences themselves
                 self.db_manager.remove_sentences_for_text(text_id)
 
-                # 4) Insert the new lines + parse
-                for (start_sec, end_sec, new_text) in self._subtitle_lines:
-                    sentence_id = self.db_manager.insert_sentence(text_id, new_text, start_sec, end_sec)
+                # 4) Insert the new lines in one batch
+                sentence_ids = self.db_manager.insert_sentences(
+                    text_id, [(line.text, line.start, line.end) for line in lines]
+                )
 
-                    tokens = self.parser.parse_content(new_text)
+                # 5) Write dictionary/surface forms for the parsed tokens in bulk
+                token_rows = []  # (sentence_id, token)
+                for sentence_id, tokens in zip(sentence_ids, tokens_per_line):
                     for tk in tokens:
-                        dict_form_id = self.db_manager.get_or_create_dictionary_form(
-                            base_form=tk["base_form"],
-                            reading=tk["reading"],
-                            pos=tk["pos"]
-                        )
-                        sf_id = self.db_manager.add_surface_form(
-                            dict_form_id=dict_form_id,
-                            surface_form=tk["surface_form"],
-                            reading=tk["reading"],
-                            pos=tk["pos"],
-                            sentence_id=sentence_id,
-                            card_id=None,
-                            parse_kanji=False
-                        )
-                        # add_surface_form increments frequency by +1
-
-                    self.update_unknown_count_for_sentence(sentence_id)
+                        token_rows.append((sentence_id, tk))
+
+                dict_form_ids = self.db_manager.upsert_dictionary_forms(
+                    [(tk["base_form"], tk["reading"], tk["pos"]) for (_sid, tk) in token_rows]
+                )
+                # each row increments its surface form's frequency by +1
+                self.db_manager.add_surface_forms_bulk([
+                    (dict_form_id, tk["surface_form"], tk["reading"], tk["pos"], sentence_id)
+                    for dict_form_id, (sentence_id, tk) in zip(dict_form_ids, token_rows)
+                ])
+
+                self.db_manager.update_unknown_counts_for_sentences(sentence_ids)
 
+            # The saved lines changed the 'sentences' table; rebuild the index on next use.
+            self._sentences_index = None
+            self._invalidate_anki_forms()
             QMessageBox.information(self, "Save Complete", "Subtitles updated in the database.")
 
         except Exception as e:
@@ -902,39 +1256,44 @@ class SubtitleWindow(QDialog):
     def find_untouched_subtitle_line(self):
         """
         Look for a line in the current (edited) _subtitle_lines that also appears
-        in the original _original_subtitle_lines. Return that tuple or None.
+        in the original _original_subtitle_lines. Return that SubLine or None.
         """
         original_set = set(self._original_subtitle_lines)
         for line in self._subtitle_lines:
-            if line in original_set:
+            if (line.start, line.end, line.text) in original_set:
                 return line
         return None
 
+    @staticmethod
+    def _sentence_key(content, start_sec, end_sec):
+        """Key for _sentences_index; times are compared at millisecond precision."""
+        return (content, round(start_sec * 1000), round(end_sec * 1000))
+
+    def _build_sentences_index(self):
+        cur = self.db_manager._conn.cursor()
+        cur.execute("SELECT text_id, content, start_time, end_time FROM sentences")
+        index = {}
+        for text_id, content, start_time, end_time in cur:
+            if start_time is None or end_time is None:
+                continue
+            index.setdefault(self._sentence_key(content, start_time, end_time), text_id)
+        return index
+
     def get_current_text_id_for_editor(self) -> Optional[int]:
         """
         Use find_untouched_subtitle_line() to pick a line that hasn't changed,
-        and query the DB's 'sentences' table to find text_id by matching
-        (content, start_time, end_time) within a small float tolerance.
+        and look up its text_id by (content, start_time, end_time) in an index
+        of the 'sentences' table that is loaded once and dropped after a save.
         """
         unchanged_line = self.find_untouched_subtitle_line()
         if unchanged_line is None:
             return None
 
-        (start_sec, end_sec, content) = unchanged_line
+        if self._sentences_index is None:
+            self._sentences_index = self._build_sentences_index()
 
-        cur = self.db_manager._conn.cursor()
-        cur.execute("""
-            SELECT text_id
-              FROM sentences
-             WHERE content = ?
-               AND ABS(start_time - ?) < 0.001
-               AND ABS(end_time - ?) < 0.001
-             LIMIT 1
-        """, (content, start_sec, end_sec))
-        row = cur.fetchone()
-        if row:
-            return row[0]
-        return None
+        key = self._sentence_key(unchanged_line.text, unchanged_line.start, unchanged_line.end)
+        return self._sentences_index.get(key)
 
     def decrement_surface_form_frequency(self, surface_form_id: int):
         cur = self.db_manager._conn.cursor()
@@ -943,7 +1302,7 @@ class SubtitleWindow(QDialog):
                SET frequency = frequency - 1
              WHERE surface_form_id = ?
         """, (surface_form_id,))
-        self.db_manager._conn.commit()
+        self.db_manager.commit()
 
     def get_surface_form_frequency(self, surface_form_id: int) -> int:
         cur = self.db_manager._conn.cursor()
@@ -956,7 +1315,7 @@ class SubtitleWindow(QDialog):
     def remove_surface_form_completely(self, surface_form_id: int):
         cur = self.db_manager._conn.cursor()
         cur.execute("DELETE FROM surface_forms WHERE surface_form_id = ?", (surface_form_id,))
-        self.db_manager._conn.commit()
+        self.db_manager.commit()
 
     def on_split_subtitle_clicked(self):
         selected_index = self.editor_button_group.checkedId()
@@ -964,7 +1323,8 @@ class SubtitleWindow(QDialog):
             QMessageBox.warning(self, "Split Subtitle", "No subtitle selected.")
             return
 
-        start_sec, end_sec, full_text = self._subtitle_lines[selected_index]
+        line = self._subtitle_lines[selected_index]
+        start_sec, end_sec, full_text = line.start, line.end, line.text
 
         # 1) Grab mpv from the parent (which is usually your main window)
         main_window = self.parent()
@@ -1000,8 +1360,8 @@ class SubtitleWindow(QDialog):
             del self._subtitle_lines[selected_index]
             # ...Insert the two new lines in its place
             # (You might want to keep the same index for the first, then insert the second right after)
-            self._subtitle_lines.insert(selected_index, new_subs[1])
-            self._subtitle_lines.insert(selected_index, new_subs[0])
+            self._subtitle_lines.insert(selected_index, SubLine(*new_subs[1]))
+            self._subtitle_lines.insert(selected_index, SubLine(*new_subs[0]))
 
             # Rebuild the editor
             self.refresh_subtitle_editor()
@@ -1018,7 +1378,7 @@ class SubtitleWindow(QDialog):
             return
 
         # Get the selected subtitle’s start/end
-        curr_start, curr_end, curr_text = self._subtitle_lines[selected_index]
+        curr_start = self._subtitle_lines[selected_index].start
 
         # Define a new subtitle that ends right before the current one (e.g. 0.05s gap).
         # We'll pick a 1-second duration by default, or clamp it if it goes below 0.
@@ -1031,7 +1391,7 @@ class SubtitleWindow(QDialog):
             new_start = 0
             new_end = 1.0
 
-        new_subtitle = (new_start, new_end, "New subtitle")
+        new_subtitle = SubLine(new_start, new_end, "New subtitle")
 
         # Insert it into the list
         self._subtitle_lines.insert(selected_index, new_subtitle)
@@ -1059,13 +1419,13 @@ class SubtitleWindow(QDialog):
             return
 
         # Get the selected subtitle’s start/end
-        curr_start, curr_end, curr_text = self._subtitle_lines[selected_index]
+        curr_end = self._subtitle_lines[selected_index].end
 
         # Define a new subtitle that starts right after the current one, 0.05s gap
         gap = 0.05
         new_start = curr_end + gap
         new_end = new_start + 1.0  # 1-second duration by default
-        new_subtitle = (new_start, new_end, "New subtitle")
+        new_subtitle = SubLine(new_start, new_end, "New subtitle")
 
         # Insert it at index+1
         insert_pos = selected_index + 1
@@ -1113,38 +1473,36 @@ class SubtitleWindow(QDialog):
                                 "Remember to Save Changes if you want to keep this deletion.")
 
     def adjust_subtitle_time(self, index, is_start, delta):
-        start_sec, end_sec, text = self._subtitle_lines[index]
+        line = self._subtitle_lines[index]
 
+        # Update the current subtitle in memory
         if is_start:
-            new_start = start_sec + delta
+            new_start = line.start + delta
             if new_start < 0:
                 new_start = 0
-            if new_start >= end_sec:
-                new_start = end_sec - 0.01
-            start_sec = new_start
+            if new_start >= line.end:
+                new_start = line.end - 0.01
+            line.start = new_start
         else:
-            new_end = end_sec + delta
+            new_end = line.end + delta
             if new_end < 0:
                 new_end = 0
-            if new_end <= start_sec:
-                new_end = start_sec + 0.01
-            end_sec = new_end
-
-        # Update the current subtitle in memory
-        self._subtitle_lines[index] = (start_sec, end_sec, text)
-
-        # *Optional* step: if you want to do any quick checks against
-        # the next/previous sub BEFORE you fix collisions, do it here.
-
-        # Fix collisions
-        self.fix_collision_forward(index)
-        self.fix_collision_backward(index)
-
-        # *After* collisions are fixed, you can do a check to see if
-        # there's still any overlap that couldn't be fixed automatically
-        if self.check_any_remaining_overlap(index):
-            # For example, show a message or forcibly change times:
-            self.fix_all_overlaps(min_gap=0.05)
+            if new_end <= line.start:
+                new_end = line.start + 0.01
+            line.end = new_end
+
+        # Fast path: the collision fixers only act when a neighbour is closer
+        # than their default min_gap, so skip them when nothing is that close.
+        if self._overlaps_next(index - 1, 0.01) or self._overlaps_next(index, 0.01):
+            # Fix collisions
+            self.fix_collision_forward(index)
+            self.fix_collision_backward(index)
+
+            # *After* collisions are fixed, you can do a check to see if
+            # there's still any overlap that couldn't be fixed automatically
+            if self.check_any_remaining_overlap(index):
+                # For example, show a message or forcibly change times:
+                self.fix_all_overlaps(min_gap=0.05)
 
         # Refresh the row UI
         self._refresh_editor_row(index)
@@ -1153,26 +1511,21 @@ class SubtitleWindow(QDialog):
         if index < len(self._subtitle_lines) - 1:
             self._refresh_editor_row(index + 1)
 
+    def _overlaps_next(self, index, min_gap=0.0) -> bool:
+        """
+        True if line index+1 starts less than min_gap after line index ends.
+        Out-of-range indices (no such pair) are never overlapping.
+        """
+        if index < 0 or index + 1 >= len(self._subtitle_lines):
+            return False
+        return self._subtitle_lines[index + 1].start < self._subtitle_lines[index].end + min_gap
+
     def check_any_remaining_overlap(self, index) -> bool:
         """
         Returns True if there's still any overlap between self._subtitle_lines[index]
         and its neighbors AFTER fix_collision_... attempts.
         """
-        start_sec, end_sec, _ = self._subtitle_lines[index]
-
-        # Check overlap with the previous subtitle
-        if index > 0:
-            prev_start, prev_end, _ = self._subtitle_lines[index - 1]
-            if prev_end > start_sec:  # means overlap
-                return True
-
-        # Check overlap with the next subtitle
-        if index < len(self._subtitle_lines) - 1:
-            next_start, next_end, _ = self._subtitle_lines[index + 1]
-            if next_start < end_sec:  # means overlap
-                return True
-
-        return False
+        return self._overlaps_next(index - 1) or self._overlaps_next(index)
 
     def fix_collision_forward(self, index, min_gap=0.01):
         """
@@ -1181,46 +1534,41 @@ class SubtitleWindow(QDialog):
         no longer overlaps the current one.
         """
         # current sub's times
-        startA, endA, textA = self._subtitle_lines[index]
+        sub_a = self._subtitle_lines[index]
 
         # If there's a next subtitle
         if index + 1 < len(self._subtitle_lines):
-            startB, endB, textB = self._subtitle_lines[index + 1]
+            sub_b = self._subtitle_lines[index + 1]
 
             # The earliest startB can be, without overlapping
-            required_startB = endA + min_gap
+            required_startB = sub_a.end + min_gap
 
-            if startB < required_startB:
+            if sub_b.start < required_startB:
                 # So the two subs overlap. We'll clamp sub B to start at required_startB.
-                new_startB = required_startB
-
-                # If new_startB >= endB, the next sub has no positive duration left,
-                # so you can either delete it or clamp it to 0.01s, etc.
-                if new_startB >= endB:
-                    # Example: remove the sub if it's now zero-length
+                # If that leaves no positive duration, the next sub is removed,
+                # otherwise it is "shortened" by moving its start forward.
+                if required_startB >= sub_b.end:
                     del self._subtitle_lines[index + 1]
                 else:
-                    # "Shorten" sub B by moving its start forward
-                    self._subtitle_lines[index + 1] = (new_startB, endB, textB)
+                    sub_b.start = required_startB
 
     def fix_collision_backward(self, index, min_gap=0.01):
         """
         If sub[index] intrudes into the *previous* subtitle,
         we 'shorten' the previous sub’s end time so no overlap remains.
         """
-        startA, endA, textA = self._subtitle_lines[index]
+        sub_a = self._subtitle_lines[index]
         if index - 1 >= 0:
-            startB, endB, textB = self._subtitle_lines[index - 1]
-            required_endB = startA - min_gap
-            if endB > required_endB:
-                new_endB = required_endB
-                if new_endB <= startB:
+            sub_b = self._subtitle_lines[index - 1]
+            required_endB = sub_a.start - min_gap
+            if sub_b.end > required_endB:
+                if required_endB <= sub_b.start:
                     # That means sub B is zero-length or inverted => remove it
                     del self._subtitle_lines[index - 1]
                     # adjust 'index' because the list shrinks
                 else:
                     # shorten the previous sub’s end
-                    self._subtitle_lines[index - 1] = (startB, new_endB, textB)
+                    sub_b.end = required_endB
 
     def fix_all_overlaps(self, min_gap=0.02):
         """
@@ -1228,21 +1576,18 @@ class SubtitleWindow(QDialog):
         to ensure no overlaps. Subtitles that collide will be 'pushed forward'.
         """
         # 1) Sort in-place by start time
-        self._subtitle_lines.sort(key=lambda sub: sub[0])
+        self._subtitle_lines.sort(key=attrgetter("start"))
 
         # 2) Single pass to ensure each sub starts after the previous ends + min_gap
-        for i in range(len(self._subtitle_lines) - 1):
-            startA, endA, textA = self._subtitle_lines[i]
-            startB, endB, textB = self._subtitle_lines[i + 1]
-
+        lines = self._subtitle_lines
+        for sub_a, sub_b in zip(lines, lines[1:]):
             # We want: startB >= endA + min_gap
-            required_startB = endA + min_gap
-            if startB < required_startB:
+            required_startB = sub_a.end + min_gap
+            if sub_b.start < required_startB:
                 # shift sub B forward
-                shift = required_startB - startB
-                startB += shift
-                endB += shift
-                self._subtitle_lines[i + 1] = (startB, endB, textB)
+                shift = required_startB - sub_b.start
+                sub_b.start += shift
+                sub_b.end += shift
 
         # 3) Optionally do a second pass right-to-left if you want minimal “stretch”.
         #    Or just do as many passes as needed until stable. Something like:
@@ -1259,18 +1604,16 @@ class SubtitleWindow(QDialog):
     def _refresh_editor_row(self, index):
         """Helper to update row UI from self._subtitle_lines[index]."""
         row_widget = self.subtitle_editor_rows[index]
-        start_sec, end_sec, text = self._subtitle_lines[index]
-        row_widget._start_edit.setText(self.seconds_to_hhmmss(start_sec))
-        row_widget._end_edit.setText(self.seconds_to_hhmmss(end_sec))
+        line = self._subtitle_lines[index]
+        row_widget._start_edit.setText(self.seconds_to_hhmmss(line.start))
+        row_widget._end_edit.setText(self.seconds_to_hhmmss(line.end))
         # If you also allow changing text, you can update that too if needed.
 
     def fix_minimum_duration(self, min_dur=0.4):
-        for i, (start, end, text) in enumerate(self._subtitle_lines):
-            dur = end - start
+        for line in self._subtitle_lines:
+            dur = line.end - line.start
             if dur < min_dur:
-                needed = min_dur - dur
-                end += needed
-                self._subtitle_lines[i] = (start, end, text)
+                line.end += min_dur - dur
         # Then possibly fix overlaps again,
         # because extending the end might now collide with the next sub.
 
@@ -1350,8 +1693,11 @@ class SubtitleWindow(QDialog):
         detect unchanged lines later.
         """
         logger.info("Setting %d subtitle lines", len(subtitle_lines))
-        self._subtitle_lines = list(subtitle_lines)
-        self._original_subtitle_lines = list(subtitle_lines)  # keep a copy for reference
+        self._subtitle_lines = [SubLine(start, end, text) for (start, end, text) in subtitle_lines]
+        self._sentences_index = None  # new subtitles may have been indexed since
+        self._video_path_cache.clear()
+        # keep an immutable (start, end, text) copy for reference
+        self._original_subtitle_lines = [tuple(line) for line in subtitle_lines]
 
         self.list_widget.clear()
         if hasattr(self, "word_viewer_list_widget"):
@@ -1372,17 +1718,16 @@ class SubtitleWindow(QDialog):
         row = self.list_widget.row(item)
         if row < 0 or row >= len(self._subtitle_lines):
             return
-        start_time, end_time, text = self._subtitle_lines[row]
-        self.subtitleDoubleClicked.emit(start_time)
+        self.subtitleDoubleClicked.emit(self._subtitle_lines[row].start)
         self.display_words_for_subtitle(row)
 
     def on_word_viewer_item_double_clicked(self, item: QListWidgetItem):
         row = self.word_viewer_list_widget.row(item)
         if row < 0 or row >= len(self._subtitle_lines):
             return
-        start_time, end_time, text = self._subtitle_lines[row]
-        self.subtitleDoubleClicked.emit(start_time)
-        self.populate_word_viewer(text)
+        line = self._subtitle_lines[row]
+        self.subtitleDoubleClicked.emit(line.start)
+        self.populate_word_viewer(line.text)
 
 
     def clear_selected_words(self):
@@ -1392,7 +1737,7 @@ class SubtitleWindow(QDialog):
     def display_words_for_subtitle(self, index: int):
         if index < 0 or index >= len(self._subtitle_lines):
             return
-        start_time, end_time, text = self._subtitle_lines[index]
+        text = self._subtitle_lines[index].text
         self.clear_selected_words()
         self.clear_grid_layout()
 
@@ -1475,8 +1820,12 @@ class SubtitleWindow(QDialog):
         if not self.db_manager:
             return
 
-        self.db_manager.set_dictionary_form_known(dict_form_id, is_known)
-        self.db_manager.update_unknown_counts_for_dict_form(dict_form_id)
+        # One deferred commit covers a burst of toggles (see _schedule_commit)
+        self.db_manager.set_dictionary_form_known(dict_form_id, is_known, commit=False)
+        self.db_manager.update_unknown_counts_for_dict_form(dict_form_id, commit=False)
+        self._schedule_commit()
+        self._invalidate_anki_forms(dict_form_id)
+        self._dict_form_info_cache.pop(dict_form_id, None)
 
         # Optionally, re-draw the subtitle words to update colors
         current_row = self.list_widget.currentRow()
@@ -1552,8 +1901,8 @@ class SubtitleWindow(QDialog):
 
     def highlight_current_time(self, current_time: float):
         active_index = -1
-        for i, (start, end, txt) in enumerate(self._subtitle_lines):
-            if start <= current_time < end:
+        for i, line in enumerate(self._subtitle_lines):
+            if line.start <= current_time < line.end:
                 active_index = i
                 break
         if active_index >= 0:
@@ -1570,8 +1919,9 @@ class SubtitleWindow(QDialog):
                         self.word_viewer_list_widget.scrollToItem(w_item)
 
                 if self.stacked_widget.currentWidget() == self.page_word_viewer:
-                    _s, _e, txt = self._subtitle_lines[active_index]
-                    self.populate_word_viewer(txt)
+                    self.populate_word_viewer(self._subtitle_lines[active_index].text)
+                    # Warm the cache for the next lines once this one is painted
+                    QTimer.singleShot(0, lambda i=active_index: self._prefetch_text_forms(i))
                 else:
                     self.display_words_for_subtitle(active_index)
         else:
@@ -1630,6 +1980,11 @@ class SubtitleWindow(QDialog):
         self.deck_combo = QComboBox()
         title_layout.addWidget(QLabel("Deck:"))
         title_layout.addWidget(self.deck_combo)
+        btn_refresh_decks = QPushButton("Refresh Decks")
+        btn_refresh_decks.setToolTip("Re-read the deck list from Anki now")
+        # Bypasses _DECK_SYNC_TTL, so a deck just created in Anki shows up
+        btn_refresh_decks.clicked.connect(lambda _checked: self.sync_anki(force=True))
+        title_layout.addWidget(btn_refresh_decks)
         title_layout.addStretch()
 
         outer_layout.addLayout(title_layout)
@@ -1665,6 +2020,12 @@ class SubtitleWindow(QDialog):
         self.field_native_sentence = QPlainTextEdit()
         self.field_native_sentence.setFixedHeight(60)
         form_layout.addRow("Native Sentence:", self.field_native_sentence)
+        # Parse the sentence ahead of time once the user stops typing
+        self._pretokenize_timer = QTimer(self)
+        self._pretokenize_timer.setSingleShot(True)
+        self._pretokenize_timer.setInterval(300)
+        self._pretokenize_timer.timeout.connect(self._schedule_bg_parse)
+        self.field_native_sentence.textChanged.connect(self._pretokenize_timer.start)
 
         # 5) POS
         self.field_pos = QPlainTextEdit()
@@ -1713,20 +2074,28 @@ class SubtitleWindow(QDialog):
         self.image_preview_label.setScaledContents(True)
         preview_layout.addWidget(self.image_preview_label)
         images_form.addRow("Preview:", self.image_preview)
+        # Typing in the Images field only restarts this timer; the previews are
+        # rebuilt once the text has been stable for 150 ms.
+        self._img_refresh_timer = QTimer(self)
+        self._img_refresh_timer.setSingleShot(True)
+        self._img_refresh_timer.setInterval(150)
+        self._img_refresh_timer.timeout.connect(self._do_rebuild_image_previews)
         self.field_image.textChanged.connect(self.on_field_image_changed)
 
         image_layout = QVBoxLayout()
-        self.images_scroll = QScrollArea()
-        self.images_scroll.setWidgetResizable(True)
-
-        self.images_container = QWidget()
-        self.images_layout = QHBoxLayout(self.images_container)
-        self.images_layout.setSpacing(5)
-        self.images_layout.setContentsMargins(0, 0, 0, 0)
-        self.images_container.setLayout(self.images_layout)
-
-        self.images_scroll.setWidget(self.images_container)
-        image_layout.addWidget(self.images_scroll)
+        # One horizontal strip of previews; the model only decodes visible items
+        self._image_model = ImagePreviewModel(self._get_thumbnail, self)
+        self.images_view = QListView()
+        self.images_view.setViewMode(QListView.IconMode)
+        self.images_view.setFlow(QListView.LeftToRight)
+        self.images_view.setWrapping(False)
+        self.images_view.setMovement(QListView.Static)
+        self.images_view.setResizeMode(QListView.Adjust)
+        self.images_view.setUniformItemSizes(True)
+        self.images_view.setIconSize(QSize(_THUMB_SIZE, _THUMB_SIZE))
+        self.images_view.setSpacing(5)
+        self.images_view.setModel(self._image_model)
+        image_layout.addWidget(self.images_view)
 
         row_img = QHBoxLayout()
         row_img.addWidget(QLabel("Video Tab:"))
@@ -1798,6 +2167,7 @@ class SubtitleWindow(QDialog):
         parent_widget.setLayout(main_vbox)
 
         self.anki_selected_dict_form_ids = set()
+        self._sel_pos = {}  # dict_form_id -> POS of the selected Anki editor words
 
 
     def on_prompt_image_clicked(self):
@@ -1859,52 +2229,126 @@ class SubtitleWindow(QDialog):
         # self.deck_combo.setCurrentIndex(0)
 
     def on_field_image_changed(self):
+        """Schedule a (debounced) rebuild of the image previews."""
+        self._img_refresh_timer.start()
+
+    def _do_rebuild_image_previews(self):
         """
-        Parse all <img src="..."> tags in self.field_image, and display
-        each image in self.images_layout as a separate QLabel.
+        Parse all <img src="..."> tags in self.field_image and show them in
+        self.images_view; the first image also goes to the Preview box.
         """
-        import re
-        from PyQt5.QtGui import QPixmap
+        # 1) Find all <img src="filename"> tags
+        textval = self.field_image.text().strip()
+        matches = _extract_img_srcs(textval) if textval else []
+
+        # 2) Stat each referenced file once per refresh; painting only reads the result
+        mtimes = {}
+        for filename in matches:
+            if filename not in mtimes:
+                try:
+                    mtimes[filename] = os.path.getmtime(os.path.join(self.anki_media_path, filename))
+                except OSError:
+                    mtimes[filename] = None
+
+        # 3) Hand the filenames to the model; previews are decoded on demand.
+        #    Also done for an unchanged list: a missing file may exist by now.
+        self._displayed_images = matches
+        self._image_model.set_filenames(matches, mtimes)
 
-        # 1) Clear out existing preview labels
-        while self.images_layout.count():
-            item = self.images_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
         self.image_preview_label.clear()
+        if matches:
+            # If still decoding, _on_thumbnail_decoded fills the preview in later
+            pixmap = self._get_thumbnail(matches[0], mtimes[matches[0]])
+            if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+                self.image_preview_label.setPixmap(pixmap)
 
-        textval = self.field_image.text().strip()
-        if not textval:
-            # No images
-            return
-
-        # 2) Find all <img src="filename"> tags
-        pattern = r'<img\s+src="([^"]+)">'
-        matches = re.findall(pattern, textval)
-        if not matches:
-            return
-
-        # 3) For each filename, create a QLabel with a 200x200 preview
-        for idx, filename in enumerate(matches):
-            label = QLabel()
-            label.setFixedSize(200, 200)
-            label.setStyleSheet("border: 1px solid gray;")
-            label.setScaledContents(True)
-
-            full_path = os.path.join(self.anki_media_path, filename)
-            if os.path.exists(full_path):
-                pixmap = QPixmap(full_path)
-                if not pixmap.isNull():
-                    label.setPixmap(pixmap)
-                    if idx == 0:
-                        self.image_preview_label.setPixmap(pixmap)
-                else:
-                    label.setText(f"Invalid image data: {filename}")
-            else:
-                label.setText(f"Missing file:\n{filename}")
+    def _seed_thumbnail(self, filename, image_data: bytes):
+        """
+        Put a preview for freshly generated image bytes into _thumb_cache, so the
+        Images tab does not read the file back from Anki's media folder.
+        Needs the stored file's mtime for the cache key; skipped if it is not
+        visible (yet) under anki_media_path.
+        """
+        try:
+            mtime = os.path.getmtime(os.path.join(self.anki_media_path, filename))
+        except OSError:
+            return
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(image_data):
+            return
+        pixmap = pixmap.scaled(_THUMB_SIZE, _THUMB_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._cache_thumbnail((filename, mtime), pixmap)
+
+    def _cache_thumbnail(self, key, pixmap):
+        self._thumb_cache[key] = pixmap
+        self._thumb_cache.move_to_end(key)
+        while len(self._thumb_cache) > _THUMB_MAX:
+            self._thumb_cache.popitem(last=False)
+
+    def _anki_media_snapshot(self) -> set:
+        """
+        Return the set of filenames in the Anki media folder. The folder is
+        only listed again when its own mtime changes (a file was added, removed
+        or renamed), so existence checks are set lookups instead of stat calls.
+        Only names are cached: a file overwritten in place keeps the folder's
+        mtime, so anything that depends on file contents must stat the file.
+        """
+        try:
+            dir_mtime = os.stat(self.anki_media_path).st_mtime_ns
+        except OSError:
+            return set()
+        if dir_mtime != self._media_snapshot_mtime:
+            with os.scandir(self.anki_media_path) as entries:
+                self._media_snapshot = {entry.name for entry in entries}
+            self._media_snapshot_mtime = dir_mtime
+        return self._media_snapshot
+
+    def _media_file_exists(self, filename) -> bool:
+        """
+        Whether `filename` is in the Anki media folder. Hits are answered from
+        _anki_media_snapshot(); a miss is confirmed on disk, since a file
+        written within the same folder-mtime tick as the last listing (coarse
+        timestamps) leaves the snapshot stale. Misses are rare.
+        """
+        if filename in self._anki_media_snapshot():
+            return True
+        return os.path.exists(os.path.join(self.anki_media_path, filename))
+
+    def _get_thumbnail(self, filename, mtime):
+        """
+        Return the preview QPixmap for an Anki media file, scaled to fit
+        _THUMB_SIZE. `mtime` comes from the stat in _do_rebuild_image_previews;
+        None means the file does not exist, and None is returned. A null
+        QPixmap means it could not be decoded. When (filename, mtime) is not
+        cached yet, a background _ImageDecodeJob is started and
+        _THUMB_PENDING is returned until it reports back.
+        """
+        if mtime is None:
+            return None
+        key = (filename, mtime)
+        full_path = os.path.join(self.anki_media_path, filename)
+
+        pixmap = self._thumb_cache.get(key)
+        if pixmap is not None:
+            self._thumb_cache.move_to_end(key)
+            return pixmap
+
+        if key not in self._thumb_jobs:
+            job = _ImageDecodeJob(filename, full_path, mtime)
+            job.signals.decoded.connect(self._on_thumbnail_decoded)
+            self._thumb_jobs[key] = job
+            QThreadPool.globalInstance().start(job)
+        return _THUMB_PENDING
+
+    def _on_thumbnail_decoded(self, filename: str, mtime: float, image: QImage):
+        """Slot for _ImageDecodeJob: convert to QPixmap on the GUI thread and show it."""
+        self._thumb_jobs.pop((filename, mtime), None)
+        pixmap = QPixmap.fromImage(image)  # stays null for undecodable files
+        self._cache_thumbnail((filename, mtime), pixmap)
 
-            self.images_layout.addWidget(label)
+        self._image_model.refresh_filename(filename)
+        if self._displayed_images and self._displayed_images[0] == filename and not pixmap.isNull():
+            self.image_preview_label.setPixmap(pixmap)
 
     # -- NEW: Build the Dictionary Search Page (page 2 in stacked_widget)
     def build_dictionary_search_page(self, parent_widget: QWidget):
@@ -1966,10 +2410,10 @@ class SubtitleWindow(QDialog):
 
         self.word_viewer_scroll = QScrollArea()
         self.word_viewer_scroll.setWidgetResizable(True)
-        container = QWidget()
-        self.word_viewer_layout = QHBoxLayout(container)
+        self.word_viewer_container = QWidget()
+        self.word_viewer_layout = QHBoxLayout(self.word_viewer_container)
         self.word_viewer_layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self.word_viewer_scroll.setWidget(container)
+        self.word_viewer_scroll.setWidget(self.word_viewer_container)
         layout.addWidget(self.word_viewer_scroll)
 
         self.btn_generate_word_image = QPushButton("Generate Image")
@@ -1994,7 +2438,8 @@ class SubtitleWindow(QDialog):
         # 1) Save the currently active Anki actions
         self._anki_actions_active = self.toolbar.actions()
 
-        # 2) Remove them from the toolbar
+        # 2) Remove them from the toolbar (repaint once, after the swap)
+        self.toolbar.setUpdatesEnabled(False)
         for act in self._anki_actions_active:
             self.toolbar.removeAction(act)
 
@@ -2004,6 +2449,7 @@ class SubtitleWindow(QDialog):
         self.toolbar.addAction(self.action_back_to_card)
 
         self._dictionary_actions = [self.action_back_to_card]
+        self.toolbar.setUpdatesEnabled(True)
 
         # Optionally pre-fill the dictionary field
         word_to_lookup = self.field_native_word.text().strip()
@@ -2030,6 +2476,7 @@ class SubtitleWindow(QDialog):
         and switch to the Anki Editor page.
         """
         # 1) Remove the dictionary action(s)
+        self.toolbar.setUpdatesEnabled(False)
         for act in self._dictionary_actions:
             self.toolbar.removeAction(act)
         self._dictionary_actions.clear()
@@ -2037,6 +2484,7 @@ class SubtitleWindow(QDialog):
         # 2) Re-add the old Anki actions
         for act in self._anki_actions_active:
             self.toolbar.addAction(act)
+        self.toolbar.setUpdatesEnabled(True)
 
         # 3) Switch to the Anki Editor page
         self.stacked_widget.setCurrentWidget(self.page_anki_editor)
@@ -2076,8 +2524,7 @@ class SubtitleWindow(QDialog):
             logger.info("No subtitle selected -> Word Viewer will be empty.")
             self.populate_word_viewer("")
         else:
-            _start, _end, text = self._subtitle_lines[current_row]
-            self.populate_word_viewer(text)
+            self.populate_word_viewer(self._subtitle_lines[current_row].text)
         if hasattr(self, "word_viewer_list_widget"):
             self.word_viewer_list_widget.setCurrentRow(current_row)
             item = self.word_viewer_list_widget.item(current_row)
@@ -2119,6 +2566,7 @@ class SubtitleWindow(QDialog):
 
         # Remove Word Viewer actions from the toolbar but keep the
         # original subtitle actions stored in _old_actions for later
+        self.toolbar.setUpdatesEnabled(False)
         self._word_viewer_actions_active = self.toolbar.actions()
         for act in self._word_viewer_actions_active:
             self.toolbar.removeAction(act)
@@ -2141,10 +2589,12 @@ class SubtitleWindow(QDialog):
             self.action_add_card,
             self.action_add_and_study,
         ]
+        self.toolbar.setUpdatesEnabled(True)
 
         # Switch to the Anki Editor page
         self.stacked_widget.setCurrentIndex(1)
         self.anki_selected_dict_form_ids.clear()
+        self._sel_pos.clear()
 
         # Fill fields based on the currently selected subtitle line
         current_row = self.list_widget.currentRow()
@@ -2154,8 +2604,7 @@ class SubtitleWindow(QDialog):
             self.clear_anki_grid_layout()
             return
 
-        _start, _end, text = self._subtitle_lines[current_row]
-        self.field_native_sentence.setPlainText(text)
+        self.field_native_sentence.setPlainText(self._subtitle_lines[current_row].text)
         sentence_id = None
         parent = self.parent()
         if parent and hasattr(parent, "_subtitle_lines"):
@@ -2179,7 +2628,8 @@ class SubtitleWindow(QDialog):
             self.deck_combo.addItem("Words")
             self.deck_combo.addItem("Study")
 
-        # 2) Remove old toolbar actions
+        # 2) Remove old toolbar actions (repaint the toolbar once, after the swap)
+        self.toolbar.setUpdatesEnabled(False)
         self._old_actions = self.toolbar.actions()
         for act in self._old_actions:
             self.toolbar.removeAction(act)
@@ -2202,10 +2652,12 @@ class SubtitleWindow(QDialog):
             self.action_add_card,
             self.action_add_and_study
         ]
+        self.toolbar.setUpdatesEnabled(True)
 
         # 4) Switch to the Anki Editor page
         self.stacked_widget.setCurrentIndex(1)
         self.anki_selected_dict_form_ids.clear()
+        self._sel_pos.clear()
 
         # 5) Fill fields from the currently selected subtitle line (if any)
         current_row = self.list_widget.currentRow()
@@ -2215,8 +2667,7 @@ class SubtitleWindow(QDialog):
             self.clear_anki_grid_layout()
             return
 
-        start_time, end_time, text = self._subtitle_lines[current_row]
-        self.field_native_sentence.setPlainText(text)
+        self.field_native_sentence.setPlainText(self._subtitle_lines[current_row].text)
         sentence_id = None
         parent = self.parent()
         if parent and hasattr(parent, "_subtitle_lines"):
@@ -2226,31 +2677,24 @@ class SubtitleWindow(QDialog):
             self.display_words_for_anki_editor(sentence_id)
 
     def on_back_to_subtitles_clicked(self):
-        print("DEBUG: Entering on_back_to_subtitles_clicked...")
         try:
+            self.toolbar.setUpdatesEnabled(False)
             for act in self._anki_actions:
-                # Only call text() if it's a QAction
+                # QWidgetAction (spacer) is a QAction too
                 if isinstance(act, QAction):
-                    print("DEBUG: Removing action:", act.text())
                     self.toolbar.removeAction(act)
-                elif isinstance(act, QWidgetAction):
-                    print("DEBUG: Removing QWidgetAction (spacer)")
-                    self.toolbar.removeAction(act)
-                else:
-                    print("DEBUG: Removing unknown object:", act)
 
             self._anki_actions.clear()
             for old_act in self._old_actions:
                 self.toolbar.addAction(old_act)
+            self.toolbar.setUpdatesEnabled(True)
 
             self.clear_anki_editor_fields()
 
             self.stacked_widget.setCurrentIndex(0)
-
-
-            print("DEBUG: Finished on_back_to_subtitles_clicked OK.")
         except Exception as e:
-            print("DEBUG: Exception in on_back_to_subtitles_clicked:", e)
+            self.toolbar.setUpdatesEnabled(True)
+            logger.exception("Error returning to the Subtitles page: %s", e)
 
     def on_add_card_triggered(self):
         """
@@ -2269,18 +2713,8 @@ class SubtitleWindow(QDialog):
         # -----------------------------------------------------------------
         # 1) Gather field data from the UI (these match your snippet fields)
         # -----------------------------------------------------------------
-        native_word_str = self.field_native_word.text().strip()
-        native_sentence_str = self.field_native_sentence.toPlainText().strip()
-        translated_word_str = self.field_translated_word.text().strip()
-        translated_sentence_str = self.field_translated_sentence.toPlainText().strip()
-        pos_value = self.field_pos.toPlainText().strip()
-        word_audio_value = self.field_word_audio.text().strip()
-        sentence_audio_value = self.field_sentence_audio.text().strip()
-        image_html = self.field_image.text().strip()
-
-        # If you have a separate "reading" field in your UI,
-        # collect that here; else set blank:
-        reading_str = ""  # or self.field_reading.text().strip()
+        fields = self._read_fields()
+        native_sentence_str = fields["native sentence"]
 
         # We can store the chosen deck name in the "deck_name" field
         # so your old code can tag it, etc.
@@ -2289,19 +2723,9 @@ class SubtitleWindow(QDialog):
         # -----------------------------------------------------------------
         # 2) Build a single 'card' dict matching your import structure
         # -----------------------------------------------------------------
-        card_data = {
-            "native word": {"value": native_word_str},
-            "native sentence": {"value": native_sentence_str},
-            "translated word": {"value": translated_word_str},
-            "translated sentence": {"value": translated_sentence_str},
-            "pos": {"value": pos_value},
-            "word audio": {"value": word_audio_value},
-            "sentence audio": {"value": sentence_audio_value},
-            "image": {"value": image_html},
-            "reading": {"value": reading_str},
-            # This helps your snippet code generate tags, etc.
-            "deck_name": deck_name
-        }
+        card_data = {name: {"value": value} for name, value in fields.items()}
+        # This helps your snippet code generate tags, etc.
+        card_data["deck_name"] = deck_name
 
         # -----------------------------------------------------------
         # 3) If the chosen deck is 'Words' or 'Study':
@@ -2321,29 +2745,22 @@ class SubtitleWindow(QDialog):
             #   self.anki.add_note(chosen_deck, "CSRS", note_type_fields, tags=tags)
             # instead of always using "Words".
             #
-            # For demo, let's define a quick variant here:
-
-            self.insert_single_card_into_db_and_anki(card_data, chosen_deck)
-            QMessageBox.information(self, "Card Created",
-                                    f"A new card has been added to your '{chosen_deck}' deck, "
-                                    "and stored in the local db_manager.")
+            # For demo, let's define a quick variant here.
+            # The sentence is parsed off the UI thread; the Anki/DB inserts
+            # run once the tokens are back.
+            def add_with_tokens(tokens):
+                self.insert_single_card_into_db_and_anki(card_data, chosen_deck, tokens=tokens)
+                QMessageBox.information(self, "Card Created",
+                                        f"A new card has been added to your '{chosen_deck}' deck, "
+                                        "and stored in the local db_manager.")
+
+            self._with_tokens(native_sentence_str, add_with_tokens)
         else:
             # Just create the Anki note, skip local DB parse
-            note_type_fields = {
-                # match the keys from your "CSRS" model
-                "native word": native_word_str,
-                "native sentence": native_sentence_str,
-                "translated word": translated_word_str,
-                "translated sentence": translated_sentence_str,
-                "pos": pos_value,
-                "word audio": word_audio_value,
-                "sentence audio": sentence_audio_value,
-                "image": image_html,
-                "reading": reading_str
-            }
+            # (the field names already match the keys of the "CSRS" model)
             tags = ["created_via_subtitles", deck_name]
 
-            note_id = self.anki.add_note(chosen_deck, "CSRS", note_type_fields, tags=tags)
+            note_id = self.anki.add_note(chosen_deck, "CSRS", fields, tags=tags)
             if note_id is None:
                 QMessageBox.warning(self, "Anki Error",
                                     "Failed to add note to Anki (no note_id returned).")
@@ -2352,25 +2769,43 @@ class SubtitleWindow(QDialog):
             QMessageBox.information(self, "Card Created",
                                     f"A new card has been added to Anki deck '{chosen_deck}' (no DB parse).")
 
-    def insert_single_card_into_db_and_anki(self, card: dict, chosen_deck: str):
+    def _read_fields(self) -> dict:
+        """
+        Read every Anki editor field once, stripped, keyed by the
+        field names of the "CSRS" note model.
+        """
+        return {
+            "native word": self.field_native_word.text().strip(),
+            "native sentence": self.field_native_sentence.toPlainText().strip(),
+            "translated word": self.field_translated_word.text().strip(),
+            "translated sentence": self.field_translated_sentence.toPlainText().strip(),
+            "pos": self.field_pos.toPlainText().strip(),
+            "word audio": self.field_word_audio.text().strip(),
+            "sentence audio": self.field_sentence_audio.text().strip(),
+            "image": self.field_image.text().strip(),
+            # There is no separate "reading" field in the editor yet
+            "reading": "",
+        }
+
+    def insert_single_card_into_db_and_anki(self, card: dict, chosen_deck: str, tokens=None):
         """
         A single-card version of your 'insert_imported_cards_into_db' logic.
         Creates the note in the chosen deck (not hard-coded to 'Words'),
         then does morphological parse, local DB insert, etc.
+        `tokens` may carry an already-parsed native sentence.
+        The card values are expected to be stripped already by the caller.
         """
-        from content_parser import ContentParser
-        parser = ContentParser()
 
         # Example code similar to your snippet, but just for one card:
-        native_word_str = card.get("native word", {}).get("value", "").strip()
-        native_sentence_str = card.get("native sentence", {}).get("value", "").strip()
-        translated_word_str = card.get("translated word", {}).get("value", "").strip()
-        translated_sentence_str = card.get("translated sentence", {}).get("value", "").strip()
-        reading_str = card.get("reading", {}).get("value", "").strip()
-        pos_value = card.get("pos", {}).get("value", "").strip()
-        word_audio_value = card.get("word audio", {}).get("value", "").strip()
-        sentence_audio_value = card.get("sentence audio", {}).get("value", "").strip()
-        image_html = card.get("image", {}).get("value", "").strip()
+        native_word_str = card.get("native word", {}).get("value", "")
+        native_sentence_str = card.get("native sentence", {}).get("value", "")
+        translated_word_str = card.get("translated word", {}).get("value", "")
+        translated_sentence_str = card.get("translated sentence", {}).get("value", "")
+        reading_str = card.get("reading", {}).get("value", "")
+        pos_value = card.get("pos", {}).get("value", "")
+        word_audio_value = card.get("word audio", {}).get("value", "")
+        sentence_audio_value = card.get("sentence audio", {}).get("value", "")
+        image_html = card.get("image", {}).get("value", "")
 
         deck_name = card.get("deck_name", chosen_deck)  # fallback
 
@@ -2404,51 +2839,52 @@ class SubtitleWindow(QDialog):
 
         anki_card_id = card_ids[0]
 
-        # Insert local DB row.
-        # Using your example DB calls:
-        words_deck_id = self.db_manager.get_deck_id_by_name(chosen_deck)
-        if not words_deck_id:
-            # Or create if missing:
-            words_deck_id = self.db_manager.ensure_Words_deck_exists()
-
-        text_id = self.db_manager.add_text_source(deck_name, "manual_add")
-        sentence_id = self.db_manager.add_sentence_if_not_exist(text_id, native_sentence_str)
-
-        card_id = self.db_manager.add_card(
-            deck_id=words_deck_id,
-            anki_card_id=anki_card_id,
-            deck_origin=deck_name,  # e.g. "Words", "Study", etc.
-            native_word=native_word_str,
-            translated_word=translated_word_str,
-            word_audio=word_audio_value,
-            pos=pos_value,
-            native_sentence=native_sentence_str,
-            translated_sentence=translated_sentence_str,
-            sentence_audio=sentence_audio_value,
-            image=image_html,
-            reading=reading_str,
-            sentence_id=sentence_id
-        )
-
         # Morphological parse of the sentence
-        tokens = parser.parse_content(native_sentence_str)
-        for tk in tokens:
-            dict_form_id = self.db_manager.get_or_create_dictionary_form(
-                base_form=tk["base_form"],
-                reading=tk["reading"],
-                pos=tk["pos"]
+        if tokens is None:
+            tokens = self._pending_tokens.pop(native_sentence_str, None)
+        if tokens is None:
+            tokens = self._content_parser().parse_content(native_sentence_str)
+
+        # Insert local DB rows in one transaction (one commit instead of one per statement)
+        with self.db_manager.transaction():
+            words_deck_id = self.db_manager.get_deck_id_by_name(chosen_deck)
+            if not words_deck_id:
+                # Or create if missing:
+                words_deck_id = self.db_manager.ensure_Words_deck_exists()
+
+            text_id = self.db_manager.add_text_source(deck_name, "manual_add")
+            sentence_id = self.db_manager.add_sentence_if_not_exist(text_id, native_sentence_str)
+
+            card_id = self.db_manager.add_card(
+                deck_id=words_deck_id,
+                anki_card_id=anki_card_id,
+                deck_origin=deck_name,  # e.g. "Words", "Study", etc.
+                native_word=native_word_str,
+                translated_word=translated_word_str,
+                word_audio=word_audio_value,
+                pos=pos_value,
+                native_sentence=native_sentence_str,
+                translated_sentence=translated_sentence_str,
+                sentence_audio=sentence_audio_value,
+                image=image_html,
+                reading=reading_str,
+                sentence_id=sentence_id
             )
-            self.db_manager.add_surface_form(
-                dict_form_id=dict_form_id,
-                surface_form=tk["surface_form"],
-                reading=tk["reading"],
-                pos=tk["pos"],
-                sentence_id=sentence_id,
-                card_id=card_id
+
+            # One upsert for all dictionary forms, then one bulk insert for the surface forms
+            dict_form_ids = self.db_manager.upsert_dictionary_forms(
+                [(tk["base_form"], tk["reading"], tk["pos"]) for tk in tokens]
             )
+            surface_rows = [
+                (dict_form_id, tk["surface_form"], tk["reading"], tk["pos"], sentence_id)
+                for dict_form_id, tk in zip(dict_form_ids, tokens)
+            ]
+            self.db_manager.add_surface_forms_bulk(surface_rows, card_id=card_id, parse_kanji=True)
 
-        self.update_unknown_count_for_sentence(sentence_id)
-        self.db_manager.update_card_tags(card_id, [deck_name])  # tag in DB
+            self.update_unknown_count_for_sentence(sentence_id)
+            self.db_manager.update_card_tags(card_id, [deck_name])  # tag in DB
+        self._anki_forms_cache.pop(sentence_id, None)
+        self._text_forms_cache.pop(native_sentence_str, None)
 
         logger.info("Inserted single card into local DB + Anki deck '%s'.", chosen_deck)
 
@@ -2457,82 +2893,161 @@ class SubtitleWindow(QDialog):
 
     def update_unknown_count_for_sentence(self, sentence_id):
         cur = self.db_manager._conn.cursor()
-        update_query = """
-        UPDATE sentences
-        SET unknown_dictionary_form_count = (
-            SELECT COUNT(DISTINCT df.dict_form_id)
-            FROM dictionary_forms df
-            JOIN surface_forms sf ON df.dict_form_id = sf.dict_form_id
-            JOIN surface_form_sentences sfs ON sf.surface_form_id = sfs.surface_form_id
-            WHERE sfs.sentence_id = sentences.sentence_id
-              AND df.known = 0
-        )
-        WHERE sentence_id = ?;
-        """
-        cur.execute(update_query, (sentence_id,))
-        self.db_manager._conn.commit()
+        cur.execute(_UPDATE_UNKNOWN_COUNT_SQL, (sentence_id,))
+        self._schedule_commit()
+
+    def _schedule_commit(self):
+        """Commit shortly after the last write, so a burst of updates shares one commit."""
+        self._commit_pending = True
+        self._commit_timer.start()
+
+    def _flush_commit(self):
+        self._commit_timer.stop()
+        if self._commit_pending and self.db_manager:
+            self.db_manager.commit()
+        self._commit_pending = False
+
+    def closeEvent(self, event):
+        self._flush_commit()
+        self._flush_anki()
+        super().closeEvent(event)
+
+    def _anki_forms_for_sentence(self, sentence_id: int):
+        """get_surface_forms_for_sentence(), memoized for the last 256 sentences."""
+        forms = self._anki_forms_cache.get(sentence_id)
+        if forms is None:
+            forms = self.db_manager.get_surface_forms_for_sentence(sentence_id)
+            self._anki_forms_cache[sentence_id] = forms
+            if len(self._anki_forms_cache) > 256:
+                self._anki_forms_cache.popitem(last=False)
+        else:
+            self._anki_forms_cache.move_to_end(sentence_id)
+        return forms
+
+    def _text_forms(self, text: str):
+        """get_surface_forms_for_text_content(), memoized for the last 256 texts."""
+        forms = self._text_forms_cache.get(text)
+        if forms is None:
+            forms = self.db_manager.get_surface_forms_for_text_content(text)
+            self._cache_text_forms(text, forms)
+        else:
+            self._text_forms_cache.move_to_end(text)
+        return forms
+
+    def _cache_text_forms(self, text: str, forms):
+        self._text_forms_cache[text] = forms
+        if len(self._text_forms_cache) > 256:
+            self._text_forms_cache.popitem(last=False)
+
+    def _prefetch_text_forms(self, index: int, count: int = 10):
+        """Fetch the Word Viewer rows of the lines after `index` in one query."""
+        if not self.db_manager:
+            return
+        texts = [line.text for line in self._subtitle_lines[index + 1:index + 1 + count]
+                 if line.text not in self._text_forms_cache]
+        if not texts:
+            return
+        for text, forms in self.db_manager.get_surface_forms_for_text_contents(texts).items():
+            self._cache_text_forms(text, forms)
+
+    def _invalidate_anki_forms(self, dict_form_id=None):
+        """Forget cached rows containing dict_form_id (all rows if None)."""
+        if dict_form_id is None:
+            self._anki_forms_cache.clear()
+            self._text_forms_cache.clear()
+            return
+        for cache in (self._anki_forms_cache, self._text_forms_cache):
+            stale = [key for key, forms in cache.items()
+                     if any(row[2] == dict_form_id for row in forms)]
+            for key in stale:
+                del cache[key]
 
     def display_words_for_anki_editor(self, sentence_id: int):
+        # One repaint for the whole rebuild
+        self.anki_word_container.setUpdatesEnabled(False)
+        try:
+            self._fill_anki_word_grid(sentence_id)
+        finally:
+            self.anki_word_container.setUpdatesEnabled(True)
+
+    def _fill_anki_word_grid(self, sentence_id: int):
         self.clear_anki_grid_layout()
         if not self.db_manager:
             return
 
-        forms = self.db_manager.get_surface_forms_for_sentence(sentence_id)
+        forms = self._anki_forms_for_sentence(sentence_id)
         if not forms:
-            no_label = QLabel("No words found for this line.")
-            self.anki_grid_layout.addWidget(no_label, 0, 0, 1, 1)
+            if self._anki_empty_label is None:
+                self._anki_empty_label = QLabel("No words found for this line.")
+                self.anki_grid_layout.addWidget(self._anki_empty_label, 0, 0, 1, 1)
+            self._anki_empty_label.show()
             return
 
         # Store the dictionary form IDs in the order they appear in this sentence
         self.anki_sentence_df_order = [df_id for (_, _, df_id, _, _) in forms]
 
-        label_select = QLabel("Select")
-        label_select.setAlignment(Qt.AlignRight)
-        label_select.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.anki_grid_layout.addWidget(label_select, 2, 0)
+        if self._anki_select_label is None:
+            self._anki_select_label = QLabel("Select")
+            self._anki_select_label.setAlignment(Qt.AlignRight)
+            self._anki_select_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+            self.anki_grid_layout.addWidget(self._anki_select_label, 2, 0)
+        self._anki_select_label.show()
 
+        # Columns are pooled: widgets are only created when a line has more
+        # words than any line shown before, otherwise they are re-labelled.
+        self._anki_row_words = [(df_id, surface) for (_, surface, df_id, _, _) in forms]
         for col_index, (sf_id, surface, df_id, base_form, known) in enumerate(forms, start=1):
-            word_label = QLabel(surface)
-            word_label.setAlignment(Qt.AlignCenter)
-            self.anki_grid_layout.addWidget(word_label, 0, col_index)
-            word_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-            self.grid_layout.setRowStretch(0, 1)
-            logger.info("word_label font: %d", word_label.font().pointSize())
-
-
-            reading_label = QLabel(f"({base_form})")
-            reading_label.setAlignment(Qt.AlignCenter)
-            self.anki_grid_layout.addWidget(reading_label, 1, col_index)
-
-            cb = QCheckBox("")
-            cb.setChecked(False)
-            cb.stateChanged.connect(
-                lambda state, d_id=df_id, s_text=surface: self.on_anki_word_checkbox_changed(d_id, s_text, state)
-            )
-            self.anki_grid_layout.addWidget(cb, 2, col_index, alignment=Qt.AlignHCenter)
-
-
-
-
-        total_cols = len(forms) + 1
-        for c in range(total_cols):
-            self.anki_grid_layout.setColumnStretch(c, 0)
-
+            if col_index > len(self._anki_row_pool):
+                word_label = QLabel()
+                word_label.setAlignment(Qt.AlignCenter)
+                self.anki_grid_layout.addWidget(word_label, 0, col_index)
+                word_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+
+                reading_label = QLabel()
+                reading_label.setAlignment(Qt.AlignCenter)
+                self.anki_grid_layout.addWidget(reading_label, 1, col_index)
+
+                cb = QCheckBox("")
+                cb.stateChanged.connect(
+                    lambda state, i=col_index - 1: self.on_anki_word_checkbox_changed(
+                        *self._anki_row_words[i], state
+                    )
+                )
+                self.anki_grid_layout.addWidget(cb, 2, col_index, alignment=Qt.AlignHCenter)
+                self._anki_row_pool.append((word_label, reading_label, cb))
 
+            word_label, reading_label, cb = self._anki_row_pool[col_index - 1]
+            word_label.setText(surface)
+            reading_label.setText(f"({base_form})")
+            for w in (word_label, reading_label, cb):
+                w.show()
 
     def clear_anki_grid_layout(self):
-        while self.anki_grid_layout.count():
-            item = self.anki_grid_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        # Hide (rather than delete) the pooled widgets; display_words_for_anki_editor reuses them
+        for word_label, reading_label, cb in self._anki_row_pool:
+            word_label.hide()
+            reading_label.hide()
+            cb.blockSignals(True)
+            cb.setChecked(False)
+            cb.blockSignals(False)
+            cb.hide()
+        for w in (self._anki_select_label, self._anki_empty_label):
+            if w is not None:
+                w.hide()
+        self._anki_row_words = []
         # Reset stored order when grid is cleared
         self.anki_sentence_df_order = []
 
-    def sync_anki(self):
+    def sync_anki(self, force: bool = False):
         """
         Fetch all decks from AnkiConnect and pass them directly to the combo box.
+        A deck list fetched less than _DECK_SYNC_TTL seconds ago is reused
+        unless `force` is set, and the combo is only refilled if it changed.
         """
+        if (not force and self._cached_deck_names
+                and time.monotonic() - self._last_deck_sync_ts < _DECK_SYNC_TTL):
+            return
+
         try:
             # 1) Get decks from Anki
             current_decks = self.anki.get_decks()  # could be a dict or list
@@ -2546,13 +3061,23 @@ class SubtitleWindow(QDialog):
             else:
                 deck_list = list(current_decks)
 
-            # (Optional) sort them
-            deck_list.sort()
+            # (Optional) sort them; Anki usually returns them sorted already
+            if deck_list != sorted(deck_list):
+                deck_list.sort()
+            self._last_deck_sync_ts = time.monotonic()
+            self._cached_deck_names = deck_list
 
-            # 3) Populate self.deck_combo
+            # 3) Populate self.deck_combo (unless it already shows exactly these decks)
+            shown = [self.deck_combo.itemText(i) for i in range(self.deck_combo.count())]
+            if shown == deck_list:
+                return
+            # Refill in one go: no per-item repaint or currentIndexChanged
+            self.deck_combo.setUpdatesEnabled(False)
+            self.deck_combo.blockSignals(True)
             self.deck_combo.clear()
-            for deck_name in deck_list:
-                self.deck_combo.addItem(deck_name)
+            self.deck_combo.addItems(deck_list)
+            self.deck_combo.blockSignals(False)
+            self.deck_combo.setUpdatesEnabled(True)
 
             logger.info(f"Populated deck_combo with {len(deck_list)} decks: {deck_list}")
 
@@ -2564,15 +3089,32 @@ class SubtitleWindow(QDialog):
         checked = (state == Qt.Checked)
         if checked:
             self.anki_selected_dict_form_ids.add(dict_form_id)
-            # Store the SURFACE form for this df_id
+            # Store the SURFACE form and the POS for this df_id (only the
+            # toggled word is looked up, not the whole selection again)
             self.anki_selected_dict_form_surfaces[dict_form_id] = surface_text
+            if self.db_manager:
+                info = self._dict_form_infos([dict_form_id]).get(dict_form_id)
+                if info:
+                    self._sel_pos[dict_form_id] = info.get("pos", "")
         else:
             self.anki_selected_dict_form_ids.discard(dict_form_id)
-            # Remove the surface if unchecked
+            # Remove the surface and POS if unchecked
             self.anki_selected_dict_form_surfaces.pop(dict_form_id, None)
+            self._sel_pos.pop(dict_form_id, None)
 
         self.update_anki_fields_from_selection()
 
+    def _dict_form_infos(self, dict_form_ids):
+        """
+        {dict_form_id: info} for the given ids; ids not seen before are
+        fetched from the DB in a single query and kept in _dict_form_info_cache.
+        """
+        missing = [df_id for df_id in dict_form_ids if df_id not in self._dict_form_info_cache]
+        if missing:
+            self._dict_form_info_cache.update(self.db_manager.get_dict_form_info_many(missing))
+        return {df_id: self._dict_form_info_cache[df_id]
+                for df_id in dict_form_ids if df_id in self._dict_form_info_cache}
+
     def update_anki_fields_from_selection(self):
         """
         Collect all selected dictionary-form IDs, fetch their SURFACE forms,
@@ -2581,23 +3123,12 @@ class SubtitleWindow(QDialog):
         if not self.db_manager:
             return
 
-        selected_surfaces = []
-        pos_list = []
-
-        # Iterate over dictionary form IDs in sentence order
-        for df_id in self.anki_sentence_df_order:
-            if df_id not in self.anki_selected_dict_form_ids:
-                continue
-
-            # 1) The surface form was cached in our dict:
-            surf = self.anki_selected_dict_form_surfaces.get(df_id, "")
-            selected_surfaces.append(surf)
-
-            # 2) Also gather POS information for the word
-            info = self.db_manager.get_dict_form_info(df_id)
-            if info:
-                pos = info.get("pos", "")
-                pos_list.append(pos)
+        # Selected dictionary form IDs in sentence order; surfaces and POS were
+        # stored when each checkbox was toggled, so there is no DB work here
+        selected = [df_id for df_id in self.anki_sentence_df_order
+                    if df_id in self.anki_selected_dict_form_ids]
+        selected_surfaces = [self.anki_selected_dict_form_surfaces.get(df_id, "") for df_id in selected]
+        pos_list = [self._sel_pos[df_id] for df_id in selected if df_id in self._sel_pos]
 
         # Join words and POS without commas
         joined_surfaces = " ".join(selected_surfaces)
@@ -2615,12 +3146,11 @@ class SubtitleWindow(QDialog):
         Attempt to parse the [sound:filename] from self.field_word_audio
         and play it via self.audio_player (which should be a QMediaPlayer).
         """
-        import re
         from PyQt5.QtCore import QUrl
         from PyQt5.QtMultimedia import QMediaContent
 
         audio_tag = self.field_word_audio.text().strip()
-        match = re.search(r'\[sound:(.*?)\]', audio_tag)
+        match = _SOUND_TAG_RE.search(audio_tag)
         if not match:
             QMessageBox.warning(self, "No Sound Tag", "No [sound:filename] found in the Word Audio field.")
             return
@@ -2628,7 +3158,7 @@ class SubtitleWindow(QDialog):
         filename = match.group(1)
         # This requires knowledge of your Anki media path
         full_path = os.path.join(self.anki_media_path, filename)
-        if not os.path.exists(full_path):
+        if not self._media_file_exists(filename):
             QMessageBox.warning(self, "File Missing", f"Audio file not found:\n{full_path}")
             return
 
@@ -2638,6 +3168,26 @@ class SubtitleWindow(QDialog):
 
         QMessageBox.information(self, "Playing Word Audio", f"Now playing: {filename}")
 
+    def _load_tts_cache(self) -> dict:
+        if not self._tts_cache_path or not os.path.exists(self._tts_cache_path):
+            return {}
+        try:
+            with open(self._tts_cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read TTS cache %s: %s", self._tts_cache_path, e)
+            return {}
+
+    def _save_tts_cache(self):
+        if not self._tts_cache_path:
+            return
+        try:
+            with open(self._tts_cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._tts_cache, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning("Could not write TTS cache %s: %s", self._tts_cache_path, e)
+
     def generate_word_audio_placeholder(self):
         """
         Generate word audio via Google TTS and store the resulting MP3
@@ -2653,6 +3203,14 @@ class SubtitleWindow(QDialog):
             QMessageBox.warning(self, "No Word", "Please enter or select a word to generate audio.")
             return
 
+        # Same text and voice as an earlier request -> reuse that file (no TTS/upload)
+        tts_key = hashlib.sha1(f"{word_text}|ja-JP|NEUTRAL".encode("utf-8")).hexdigest()
+        cached_filename = self._tts_cache.get(tts_key)
+        if cached_filename and os.path.exists(os.path.join(self.anki_media_path, cached_filename)):
+            self.field_word_audio.setText(f"[sound:{cached_filename}]")
+            QMessageBox.information(self, "Audio Generated", f"Reused word audio for '{word_text}'.")
+            return
+
         # 2) Ensure we have Google TTS credentials
         if not os.path.exists(self.google_credentials):
             QMessageBox.warning(self, "Missing Credentials", "No Google TTS credentials found.")
@@ -2662,21 +3220,24 @@ class SubtitleWindow(QDialog):
         import os, uuid, base64
         from google.cloud import texttospeech
 
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.google_credentials
-        client = texttospeech.TextToSpeechClient()
+        # The client (gRPC channel + auth) and the fixed voice settings are
+        # created on first use and shared by every later request.
+        if self._tts_client is None:
+            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.google_credentials
+            self._tts_client = texttospeech.TextToSpeechClient()
+            self._tts_voice = texttospeech.VoiceSelectionParams(
+                language_code="ja-JP",
+                ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
+            )
+            self._tts_audio_config = texttospeech.AudioConfig(audio_encoding=texttospeech.AudioEncoding.MP3)
 
         synthesis_input = texttospeech.SynthesisInput(text=word_text)
-        voice = texttospeech.VoiceSelectionParams(
-            language_code="ja-JP",
-            ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
-        )
-        audio_config = texttospeech.AudioConfig(audio_encoding=texttospeech.AudioEncoding.MP3)
 
         try:
-            response = client.synthesize_speech(
+            response = self._tts_client.synthesize_speech(
                 input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
+                voice=self._tts_voice,
+                audio_config=self._tts_audio_config
             )
         except Exception as e:
             QMessageBox.warning(self, "TTS Error", f"Failed to generate TTS audio:\n{e}")
@@ -2691,6 +3252,8 @@ class SubtitleWindow(QDialog):
         if res is None:
             QMessageBox.warning(self, "Anki Error", "Could not store TTS result in Anki media.")
             return
+        self._tts_cache[tts_key] = audio_filename
+        self._save_tts_cache()
 
         # 5) Build the [sound:filename] tag
         new_sound_tag = f"[sound:{audio_filename}]"
@@ -2701,19 +3264,18 @@ class SubtitleWindow(QDialog):
         QMessageBox.information(self, "Audio Generated", f"Generated word audio for '{word_text}'!")
 
     def play_sentence_audio_placeholder(self):
-        import re
         from PyQt5.QtCore import QUrl
         from PyQt5.QtMultimedia import QMediaContent
 
         audio_tag = self.field_sentence_audio.text().strip()
-        match = re.search(r'\[sound:(.*?)\]', audio_tag)
+        match = _SOUND_TAG_RE.search(audio_tag)
         if not match:
             QMessageBox.warning(self, "No Sound Tag", "No [sound:filename] found in the Sentence Audio field.")
             return
 
         filename = match.group(1)
         full_path = os.path.join(self.anki_media_path, filename)
-        if not os.path.exists(full_path):
+        if not self._media_file_exists(filename):
             QMessageBox.warning(self, "File Missing", f"Audio file not found:\n{full_path}")
             return
 
@@ -2725,153 +3287,248 @@ class SubtitleWindow(QDialog):
         Capture the audio for the currently selected subtitle range,
         store it in Anki’s media folder,
         then APPEND the resulting [sound:filename] tag in self.field_sentence_audio.
+        ffmpeg and the Anki upload run in the background; the field is updated when both are done.
         """
         import os
         import uuid
-        import base64
-        import subprocess
-        import tempfile
-        import shutil
         from PyQt5.QtWidgets import QMessageBox
 
-        print("[DEBUG] Entering capture_sentence_audio_placeholder...")
+        logger.debug("Entering capture_sentence_audio_placeholder...")
 
         # 1) Identify the subtitle line or index we want to capture
         index = self._last_active_index
-        print(f"[DEBUG] current subtitle index: {index}")
+        logger.debug("current subtitle index: %s", index)
         if index < 0 or index >= len(self._subtitle_lines):
-            print("[DEBUG] No valid subtitle selected (index out of range).")
+            logger.debug("No valid subtitle selected (index out of range).")
             QMessageBox.warning(self, "No Subtitle Selected", "No valid subtitle is selected.")
             return
 
-        start_sec, end_sec, text = self._subtitle_lines[index]
-        print(f"[DEBUG] subtitle range: start={start_sec}, end={end_sec}, text='{text}'")
+        line = self._subtitle_lines[index]
+        start_sec, end_sec, text = line.start, line.end, line.text
+        logger.debug("subtitle range: start=%s, end=%s, text=%r", start_sec, end_sec, text)
         if end_sec <= start_sec:
-            print("[DEBUG] Invalid start/end range.")
+            logger.debug("Invalid start/end range.")
             QMessageBox.warning(self, "Invalid Range", "Subtitle start/end times are invalid.")
             return
 
         # 2) Get the current video path
         if not self.get_current_video_path:
-            print("[DEBUG] get_current_video_path callback is None.")
+            logger.debug("get_current_video_path callback is None.")
             QMessageBox.warning(self, "No Video Reference", "Cannot capture audio without a video path reference.")
             return
 
         try:
             possible_mpv_uri = self.get_current_video_path()
         except Exception as e:
-            print(f"[DEBUG] get_current_video_path() threw an exception: {e}")
+            logger.debug("get_current_video_path() threw an exception: %s", e)
             QMessageBox.warning(self, "Video Path Error", f"Error fetching video path:\n{e}")
             return
 
-        print(f"[DEBUG] possible_mpv_uri from get_current_video_path(): {possible_mpv_uri}")
+        logger.debug("possible_mpv_uri from get_current_video_path(): %s", possible_mpv_uri)
 
         # Convert MPV URI to plain OS path if needed
         media_file = possible_mpv_uri
         if media_file.startswith("file://"):
             media_file = self.db_manager.mpv_path_to_file_path(media_file)
 
-        print(f"[DEBUG] Final media_file for ffmpeg: {media_file}")
+        logger.debug("Final media_file for ffmpeg: %s", media_file)
         if not media_file or not os.path.exists(media_file):
-            print(f"[DEBUG] media_file does not exist: {media_file}")
+            logger.debug("media_file does not exist: %s", media_file)
             QMessageBox.warning(self, "File Not Found", f"Video file does not exist:\n{media_file}")
             return
 
+        # 3) The source's audio codec is probed once per file: MP3/AAC tracks
+        #    are stream-copied instead of being decoded and re-encoded.
+        codec = self._audio_codec_cache.get(media_file)
+        if codec is None:
+            self._start_process(
+                "ffprobe",
+                ["-v", "error", "-select_streams", "a:0",
+                 "-show_entries", "stream=codec_name", "-of", "csv=p=0", media_file],
+                lambda ok, out, _err: self._on_audio_codec_probed(ok, out, media_file, start_sec, end_sec)
+            )
+            return
+        self._extract_sentence_audio(media_file, start_sec, end_sec, codec)
+
+    def _on_audio_codec_probed(self, ok, stdout, media_file, start_sec, end_sec):
+        lines = stdout.split()
+        codec = lines[0].strip().lower() if ok and lines else ""  # "" -> re-encode
+        logger.debug("Audio codec of %s: %r", media_file, codec)
+        self._audio_codec_cache[media_file] = codec
+        self._extract_sentence_audio(media_file, start_sec, end_sec, codec)
+
+    def _extract_sentence_audio(self, media_file, start_sec, end_sec, codec):
+        # Copy the track as-is when its codec fits a container Anki plays,
+        # otherwise encode to MP3
+        ext = _AUDIO_STREAM_COPY_EXT.get(codec)
+        if ext is not None:
+            codec_args = ["-map", "0:a:0", "-c:a", "copy"]
+        else:
+            ext = ".mp3"
+            codec_args = ["-map", "0:a", "-acodec", "libmp3lame"]
+
         # 3) Unique name for snippet
-        audio_filename = f"sentence_audio_{uuid.uuid4().hex}.mp3"
+        audio_filename = f"sentence_audio_{uuid.uuid4().hex}{ext}"
         audio_out_path = os.path.join(self.anki_media_path, audio_filename)
-        print(f"[DEBUG] audio_filename={audio_filename}")
-        print(f"[DEBUG] audio_out_path={audio_out_path}")
+        logger.debug("audio_filename=%s", audio_filename)
+        logger.debug("audio_out_path=%s", audio_out_path)
+
+        # 4) Use ffmpeg to extract the snippet (QProcess, so the UI keeps running);
+        #    it writes straight into the media folder, no temp file + move
+        logger.debug("Starting ffmpeg extraction...")
+        args = [
+            "-y",
+            "-ss", str(start_sec),
+            "-to", str(end_sec),
+            "-i", media_file,
+            *codec_args,
+            audio_out_path
+        ]
+        logger.debug("ffmpeg command: %s", " ".join(["ffmpeg"] + args))
 
-        # 4) Use ffmpeg to extract the snippet
-        print("[DEBUG] Starting ffmpeg extraction...")
-        try:
-            temp_audio_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-            temp_audio_path = temp_audio_file.name
-            temp_audio_file.close()
-
-            print(f"[DEBUG] temp_audio_path={temp_audio_path}")
-
-            cmd = [
-                "ffmpeg", "-y",
-                "-ss", str(start_sec),
-                "-to", str(end_sec),
-                "-i", media_file,
-                "-map", "0:a",
-                "-acodec", "libmp3lame",
-                temp_audio_path
-            ]
+        self._start_process(
+            "ffmpeg", args,
+            lambda ok, _out, err: self._on_ffmpeg_audio_done(
+                ok, err, audio_out_path, audio_filename, start_sec, end_sec
+            )
+        )
 
-            print("[DEBUG] ffmpeg command:")
-            print(" ".join(cmd))
+    def _start_process(self, program, args, on_finished):
+        """
+        Run `program args` with a QProcess and call on_finished(ok, stdout, stderr)
+        back on the UI thread once it exits (or fails to start).
+        """
+        proc = QProcess(self)
+        self._ffmpeg_procs.append(proc)
+
+        def finish(ok, stderr=None):
+            if proc not in self._ffmpeg_procs:
+                return  # errorOccurred and finished can both fire
+            self._ffmpeg_procs.remove(proc)
+            stdout = bytes(proc.readAllStandardOutput()).decode("utf-8", "replace")
+            if stderr is None:
+                stderr = bytes(proc.readAllStandardError()).decode("utf-8", "replace")
+            proc.deleteLater()
+            on_finished(ok, stdout, stderr)
+
+        proc.finished.connect(
+            lambda code, status: finish(code == 0 and status == QProcess.NormalExit)
+        )
+        proc.errorOccurred.connect(
+            lambda error: finish(False, f"{program} failed to start") if error == QProcess.FailedToStart else None
+        )
+        proc.start(program, args)
 
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    def _queue_anki(self, action, params, on_result=None):
+        """
+        Queue an AnkiConnect action; everything queued within 200 ms is sent as
+        one 'multi' request off the UI thread. An action identical to one that
+        is already pending (e.g. the same createDeck) is only sent once, and
+        every caller's on_result(result) gets its result.
+        """
+        key = (action, json.dumps(params, sort_keys=True))
+        entry = self._anki_pending.get(key)
+        if entry is None:
+            entry = self._anki_pending[key] = ({"action": action, "params": params}, [])
+        if on_result is not None:
+            entry[1].append(on_result)
+        self._anki_flush_timer.start()
+
+    def _flush_anki(self):
+        self._anki_flush_timer.stop()
+        if not self._anki_pending:
+            return
+        entries = list(self._anki_pending.values())
+        self._anki_pending.clear()
 
-            print(f"[DEBUG] ffmpeg returncode={result.returncode}")
-            if result.stdout:
-                print(f"[DEBUG] ffmpeg stdout:\n{result.stdout}")
-            if result.stderr:
-                print(f"[DEBUG] ffmpeg stderr:\n{result.stderr}")
+        job = _AnkiBatchJob(self.anki, [action for action, _callbacks in entries])
 
-            if result.returncode != 0:
-                print("[DEBUG] ffmpeg returned non-zero status.")
-                QMessageBox.warning(self, "FFmpeg Error", "Failed to extract audio snippet with ffmpeg.")
-                return
+        def done(results):
+            self._anki_batch_jobs.discard(job)
+            for i, (_action, callbacks) in enumerate(entries):
+                result = results[i] if results else None
+                for callback in callbacks:
+                    callback(result)
 
-            if not os.path.exists(temp_audio_path):
-                print(f"[DEBUG] ffmpeg did not produce file at {temp_audio_path}")
-                QMessageBox.warning(self, "Audio Error", "ffmpeg did not produce the output MP3.")
-                return
+        job.signals.done.connect(done)
+        self._anki_batch_jobs.add(job)
+        QThreadPool.globalInstance().start(job)
 
-            print(f"[DEBUG] Moving temp audio to {audio_out_path}")
-            shutil.move(temp_audio_path, audio_out_path)
+    def _store_media_in_background(self, filename, path, on_stored):
+        """
+        Store `path` in Anki as `filename` off the UI thread, then call on_stored(result).
+        Anki reads the file itself (path=, batched through _queue_anki); the
+        base64 upload in _MediaStoreJob is only used if that fails.
+        """
+        def upload_data():
+            job = _MediaStoreJob(self.anki, filename, path)
 
-        except Exception as e:
-            print(f"[DEBUG] Exception during ffmpeg extraction: {e}")
-            QMessageBox.warning(self, "Extraction Error", f"Error extracting audio:\n{e}")
+            def stored(_filename, res):
+                self._media_jobs.discard(job)
+                on_stored(res)
+
+            job.signals.stored.connect(stored)
+            self._media_jobs.add(job)
+            QThreadPool.globalInstance().start(job)
+
+        self._queue_anki(
+            "storeMediaFile", {"filename": filename, "path": path},
+            lambda res: upload_data() if res is None else on_stored(res)
+        )
+
+    def _on_ffmpeg_audio_done(self, ok, stderr, audio_out_path, audio_filename, start_sec, end_sec):
+        if stderr:
+            logger.debug("ffmpeg stderr:\n%s", stderr)
+        if not ok:
+            logger.debug("ffmpeg returned non-zero status.")
+            # Don't leave a partial snippet behind in the media folder
+            try:
+                os.remove(audio_out_path)
+            except OSError:
+                pass
+            QMessageBox.warning(self, "FFmpeg Error", "Failed to extract audio snippet with ffmpeg.")
             return
 
-        # 5) Store in Anki if needed
-        print("[DEBUG] Attempting to store in Anki media collection...")
-        try:
-            with open(audio_out_path, "rb") as f:
-                audio_data = f.read()
-            b64_data = base64.b64encode(audio_data).decode("utf-8")
-
-            res = self.anki.invoke("storeMediaFile", filename=audio_filename, data=b64_data)
-            if res is None:
-                print("[DEBUG] storeMediaFile returned None; unable to store in Anki.")
-                QMessageBox.warning(self, "Anki Error", "Could not store snippet in Anki’s media collection.")
-                return
+        if not os.path.exists(audio_out_path):
+            logger.debug("ffmpeg did not produce file at %s", audio_out_path)
+            QMessageBox.warning(self, "Audio Error", "ffmpeg did not produce the output audio file.")
+            return
 
-            # 6) Build the new sound tag
-            new_sound_tag = f"[sound:{audio_filename}]"
-            print(f"[DEBUG] Created new sound tag: {new_sound_tag}")
+        # 5) Store in Anki (base64 + HTTP round-trip on the thread pool)
+        logger.debug("Attempting to store in Anki media collection...")
+        self._store_media_in_background(
+            audio_filename, audio_out_path,
+            lambda res: self._on_sentence_audio_stored(res, audio_filename, start_sec, end_sec)
+        )
 
-            # =========== ONLY APPEND ONCE =============
-            existing_audio_tags = self.field_sentence_audio.text().strip()
-            print(f"[DEBUG] existing_audio_tags BEFORE appending: {repr(existing_audio_tags)}")
+    def _on_sentence_audio_stored(self, res, audio_filename, start_sec, end_sec):
+        if res is None:
+            logger.debug("storeMediaFile returned None; unable to store in Anki.")
+            QMessageBox.warning(self, "Anki Error", "Could not store snippet in Anki’s media collection.")
+            return
 
-            if existing_audio_tags:
-                updated_field_value = existing_audio_tags + " " + new_sound_tag
-            else:
-                updated_field_value = new_sound_tag
+        # 6) Build the new sound tag
+        new_sound_tag = f"[sound:{audio_filename}]"
+        logger.debug("Created new sound tag: %s", new_sound_tag)
 
-            print(f"[DEBUG] updated_field_value AFTER appending: {repr(updated_field_value)}")
-            self.field_sentence_audio.setText(updated_field_value)
-            # =========== DONE APPENDING ==============
+        # =========== ONLY APPEND ONCE =============
+        existing_audio_tags = self.field_sentence_audio.text().strip()
+        logger.debug("existing_audio_tags BEFORE appending: %r", existing_audio_tags)
 
-            QMessageBox.information(
-                self,
-                "Audio Captured",
-                f"Captured subtitle audio:\n{start_sec:.2f} - {end_sec:.2f}"
-            )
+        if existing_audio_tags:
+            updated_field_value = existing_audio_tags + " " + new_sound_tag
+        else:
+            updated_field_value = new_sound_tag
 
-        except Exception as e:
-            print(f"[DEBUG] Exception during Anki storeMediaFile step: {e}")
-            QMessageBox.warning(self, "Anki Error", f"Error storing snippet in Anki:\n{e}")
+        logger.debug("updated_field_value AFTER appending: %r", updated_field_value)
+        self.field_sentence_audio.setText(updated_field_value)
+        # =========== DONE APPENDING ==============
 
-        print("[DEBUG] Exiting capture_sentence_audio_placeholder normally.")
+        QMessageBox.information(
+            self,
+            "Audio Captured",
+            f"Captured subtitle audio:\n{start_sec:.2f} - {end_sec:.2f}"
+        )
 
     def get_current_video_path(self) -> str:
         """
@@ -2884,22 +3541,43 @@ class SubtitleWindow(QDialog):
         if self._last_active_index < 0 or self._last_active_index >= len(self._subtitle_lines):
             raise ValueError("No valid subtitle line is selected.")
 
-        start_sec, end_sec, text = self._subtitle_lines[self._last_active_index]
+        line = self._subtitle_lines[self._last_active_index]
+        start_sec, end_sec, text = line.start, line.end, line.text
+
+        # Resolve the line's text_id through the in-memory sentences index;
+        # every line of that text shares the cached media path.
+        if self._sentences_index is None:
+            self._sentences_index = self._build_sentences_index()
+        text_id = self._sentences_index.get(self._sentence_key(text, start_sec, end_sec))
+        if text_id is not None and text_id in self._video_path_cache:
+            return self._video_path_cache[text_id]
 
-        # Query the DB using the triple (start_time, end_time, text)
-        query = """
-        SELECT sub.media_id
-          FROM subtitles sub
-          JOIN texts t ON sub.subtitle_file = t.source
-          JOIN sentences s ON s.text_id = t.text_id
-         WHERE s.start_time = ?
-           AND s.end_time   = ?
-           AND s.content    = ?
-         LIMIT 1
-        """
         cur = self.db_manager._conn.cursor()
-        cur.execute(query, (start_sec, end_sec, text))
-        row = cur.fetchone()
+        if text_id is not None:
+            cur.execute("""
+            SELECT sub.media_id
+              FROM subtitles sub
+              JOIN texts t ON sub.subtitle_file = t.source
+             WHERE t.text_id = ?
+             LIMIT 1
+            """, (text_id,))
+            row = cur.fetchone()
+        else:
+            row = None
+        if not row:
+            # Query the DB using the triple (start_time, end_time, text)
+            query = """
+            SELECT sub.media_id
+              FROM subtitles sub
+              JOIN texts t ON sub.subtitle_file = t.source
+              JOIN sentences s ON s.text_id = t.text_id
+             WHERE s.start_time = ?
+               AND s.end_time   = ?
+               AND s.content    = ?
+             LIMIT 1
+            """
+            cur.execute(query, (start_sec, end_sec, text))
+            row = cur.fetchone()
         if not row:
             raise ValueError("Could not find a matching media_id in the DB for that subtitle line.")
 
@@ -2914,6 +3592,8 @@ class SubtitleWindow(QDialog):
         if not file_path:
             raise ValueError(f"Media ID {media_id} does not have a valid file_path in the db_manager.")
 
+        if text_id is not None:
+            self._video_path_cache[text_id] = file_path
         return file_path
 
     def play_sentence_audio_all(self):
@@ -2921,14 +3601,12 @@ class SubtitleWindow(QDialog):
         Finds all [sound:filename.mp3] tags in field_sentence_audio,
         and plays them in sequence using self.audio_player.
         """
-        import re
         from PyQt5.QtCore import QUrl
         from PyQt5.QtMultimedia import QMediaContent
 
         # 1) Extract each [sound:filename.mp3] from the field
         text = self.field_sentence_audio.text()
-        pattern = r'\[sound:(.*?)\]'
-        sound_files = re.findall(pattern, text)
+        sound_files = _SOUND_TAG_RE.findall(text)
         if not sound_files:
             print("No [sound:...] tags found in the sentence audio field.")
             return
@@ -2936,12 +3614,13 @@ class SubtitleWindow(QDialog):
         print(f"Found sound files: {sound_files}")
 
         # 2) Convert each to the full path in your anki_media_path
+        #    (existence is checked against the cached media folder listing)
         full_paths = []
         for sf in sound_files:
             # If the user stored them in self.anki_media_path
             # e.g. sf = 'sentence_audio_abc123.mp3'
             file_path = os.path.join(self.anki_media_path, sf)
-            if os.path.exists(file_path):
+            if self._media_file_exists(sf):
                 full_paths.append(file_path)
             else:
                 print(f"Missing audio file: {file_path}")
@@ -2950,196 +3629,152 @@ class SubtitleWindow(QDialog):
             print("No local files found to play.")
             return
 
-        # 3) Option A: Use a simple approach: play the first, then when that finishes,
-        #    move to the next. We connect a signal to handle the "finished" event.
-        #    QMediaPlayer doesn’t have a built-in queue, but we can do it manually.
-
-        self._current_sound_index = 0
-        self._sound_playlist = full_paths[:]  # copy
+        # 3) Queue them on a QMediaPlaylist; the player moves on to the next
+        #    file by itself, without a Python round-trip per state change.
+        from PyQt5.QtMultimedia import QMediaPlaylist
 
-        # Connect to the player’s stateChanged signal if not already:
-        self.audio_player.stateChanged.connect(self.on_audio_state_changed)
-
-        # Start playing the first
-        self.play_next_sound_in_sequence()
-
-    def play_next_sound_in_sequence(self):
-        """
-        Plays the sound file at self._sound_playlist[self._current_sound_index].
-        """
-        if not hasattr(self, '_sound_playlist'):
-            return
-        if self._current_sound_index >= len(self._sound_playlist):
-            print("All sounds played.")
-            return
-
-        next_file = self._sound_playlist[self._current_sound_index]
-        print(f"Playing: {next_file}")
-        from PyQt5.QtCore import QUrl
-        from PyQt5.QtMultimedia import QMediaContent
+        if self._sentence_playlist is None:
+            self._sentence_playlist = QMediaPlaylist(self.audio_player)
+            self._sentence_playlist.setPlaybackMode(QMediaPlaylist.Sequential)
+        playlist = self._sentence_playlist
+        playlist.clear()
+        for path in full_paths:
+            playlist.addMedia(QMediaContent(QUrl.fromLocalFile(path)))
+        playlist.setCurrentIndex(0)
 
-        self.audio_player.setMedia(QMediaContent(QUrl.fromLocalFile(next_file)))
+        self.audio_player.setPlaylist(playlist)
         self.audio_player.play()
 
-    def on_audio_state_changed(self, new_state):
-        """
-        Called whenever QMediaPlayer changes state.
-        If it transitions to StoppedState, we try the next audio file.
-        """
-        from PyQt5.QtMultimedia import QMediaPlayer
-        if new_state == QMediaPlayer.StoppedState:
-            # Move to next file
-            if hasattr(self, '_sound_playlist') and self._sound_playlist:
-                self._current_sound_index += 1
-                if self._current_sound_index < len(self._sound_playlist):
-                    self.play_next_sound_in_sequence()
-                else:
-                    print("Finished playing all queued sounds.")
-
     def capture_screenshot_placeholder(self):
         """
         Capture a screenshot from the current video around the midpoint of the
         selected subtitle range, store it in Anki’s media folder,
         and append a <img src="filename.png"> to a target field (like self.field_image).
+        ffmpeg and the Anki upload run in the background; the field is updated when both are done.
         """
         import os
         import uuid
-        import base64
-        import subprocess
-        import tempfile
-        import shutil
         from PyQt5.QtWidgets import QMessageBox
 
-        print("[DEBUG] Entering capture_screenshot_placeholder...")
+        logger.debug("Entering capture_screenshot_placeholder...")
 
         # 1) Identify current subtitle line
         index = self._last_active_index
-        print(f"[DEBUG] current subtitle index: {index}")
+        logger.debug("current subtitle index: %s", index)
         if index < 0 or index >= len(self._subtitle_lines):
-            print("[DEBUG] No valid subtitle selected (index out of range).")
+            logger.debug("No valid subtitle selected (index out of range).")
             QMessageBox.warning(self, "No Subtitle Selected", "No valid subtitle is selected.")
             return
 
-        start_sec, end_sec, text = self._subtitle_lines[index]
-        print(f"[DEBUG] subtitle range: start={start_sec}, end={end_sec}, text='{text}'")
+        line = self._subtitle_lines[index]
+        start_sec, end_sec, text = line.start, line.end, line.text
+        logger.debug("subtitle range: start=%s, end=%s, text=%r", start_sec, end_sec, text)
         if end_sec <= start_sec:
-            print("[DEBUG] Invalid start/end range.")
+            logger.debug("Invalid start/end range.")
             QMessageBox.warning(self, "Invalid Range", "Subtitle start/end times are invalid.")
             return
 
         # 2) Get the current video path
         if not self.get_current_video_path:
-            print("[DEBUG] get_current_video_path callback is None.")
+            logger.debug("get_current_video_path callback is None.")
             QMessageBox.warning(self, "No Video Reference", "Cannot capture screenshot without a video reference.")
             return
 
         try:
             possible_mpv_uri = self.get_current_video_path()
         except Exception as e:
-            print(f"[DEBUG] get_current_video_path() threw an exception: {e}")
+            logger.debug("get_current_video_path() threw an exception: %s", e)
             QMessageBox.warning(self, "Video Path Error", f"Error fetching video path:\n{e}")
             return
 
-        print(f"[DEBUG] possible_mpv_uri from get_current_video_path(): {possible_mpv_uri}")
+        logger.debug("possible_mpv_uri from get_current_video_path(): %s", possible_mpv_uri)
 
         # Convert MPV URI to plain OS path if needed
         media_file = possible_mpv_uri
         if media_file.startswith("file://"):
             media_file = self.db_manager.mpv_path_to_file_path(media_file)
 
-        print(f"[DEBUG] Final media_file for ffmpeg screenshot: {media_file}")
+        logger.debug("Final media_file for ffmpeg screenshot: %s", media_file)
         if not media_file or not os.path.exists(media_file):
-            print(f"[DEBUG] media_file does not exist: {media_file}")
+            logger.debug("media_file does not exist: %s", media_file)
             QMessageBox.warning(self, "File Not Found", f"Video file does not exist:\n{media_file}")
             return
 
         # 3) Construct a unique name for the screenshot (e.g., .png or .jpg)
         image_filename = f"sentence_img_{uuid.uuid4().hex}.png"
         image_out_path = os.path.join(self.anki_media_path, image_filename)
-        print(f"[DEBUG] image_filename={image_filename}")
-        print(f"[DEBUG] image_out_path={image_out_path}")
+        logger.debug("image_filename=%s", image_filename)
+        logger.debug("image_out_path=%s", image_out_path)
 
         # 4) ffmpeg: capture a single frame at the midpoint
         midpoint_sec = (start_sec + end_sec) / 2.0
-        print(f"[DEBUG] midpoint time for screenshot: {midpoint_sec}")
-
-        try:
-            cmd = [
-                "ffmpeg", "-y",
-                "-ss", str(midpoint_sec),
-                "-i", media_file,
-                "-vframes", "1",
-                "-filter:v", "scale=400:-1",  # 400 wide, keep aspect ratio
-                image_out_path
-            ]
-
-            print("[DEBUG] ffmpeg screenshot command:")
-            print(" ".join(cmd))
-
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-            print(f"[DEBUG] ffmpeg returncode={result.returncode}")
-            if result.stdout:
-                print(f"[DEBUG] ffmpeg stdout:\n{result.stdout}")
-            if result.stderr:
-                print(f"[DEBUG] ffmpeg stderr:\n{result.stderr}")
-
-            if result.returncode != 0:
-                print("[DEBUG] ffmpeg returned non-zero status.")
-                QMessageBox.warning(self, "FFmpeg Error", "Failed to capture screenshot with ffmpeg.")
-                return
+        logger.debug("midpoint time for screenshot: %s", midpoint_sec)
+
+        args = [
+            "-y",
+            "-ss", str(midpoint_sec),  # input-side seek: jump to the nearest keyframe
+            "-i", media_file,
+            "-frames:v", "1",
+            "-an", "-sn", "-dn",  # don't demux audio/subtitle/data streams
+            "-filter:v", "scale=400:-1",  # 400 wide, keep aspect ratio
+            image_out_path
+        ]
+        logger.debug("ffmpeg screenshot command: %s", " ".join(["ffmpeg"] + args))
 
-            if not os.path.exists(image_out_path):
-                print("[DEBUG] ffmpeg did not produce the image file.")
-                QMessageBox.warning(self, "Screenshot Error", "ffmpeg did not produce the image file.")
-                return
+        self._start_process(
+            "ffmpeg", args,
+            lambda ok, _out, err: self._on_ffmpeg_screenshot_done(
+                ok, err, image_out_path, image_filename, midpoint_sec
+            )
+        )
 
-        except Exception as e:
-            print(f"[DEBUG] Exception during ffmpeg screenshot: {e}")
-            QMessageBox.warning(self, "Extraction Error", f"Error capturing screenshot:\n{e}")
+    def _on_ffmpeg_screenshot_done(self, ok, stderr, image_out_path, image_filename, midpoint_sec):
+        if stderr:
+            logger.debug("ffmpeg stderr:\n%s", stderr)
+        if not ok:
+            logger.debug("ffmpeg returned non-zero status.")
+            QMessageBox.warning(self, "FFmpeg Error", "Failed to capture screenshot with ffmpeg.")
             return
 
-        # 5) Optionally store in Anki
-        print("[DEBUG] Attempting to store screenshot in Anki media collection...")
-        try:
-            with open(image_out_path, "rb") as f:
-                image_data = f.read()
-            b64_data = base64.b64encode(image_data).decode("utf-8")
-
-            res = self.anki.invoke("storeMediaFile", filename=image_filename, data=b64_data)
-            if res is None:
-                print("[DEBUG] storeMediaFile returned None; unable to store in Anki.")
-                QMessageBox.warning(self, "Anki Error", "Could not store screenshot in Anki’s media collection.")
-                return
+        if not os.path.exists(image_out_path):
+            logger.debug("ffmpeg did not produce the image file.")
+            QMessageBox.warning(self, "Screenshot Error", "ffmpeg did not produce the image file.")
+            return
 
-            # 6) Build the <img src="filename.png"> tag
-            new_img_tag = f'<img src="{image_filename}">'
-            print(f"[DEBUG] Created new img tag: {new_img_tag}")
+        # 5) Optionally store in Anki (base64 + HTTP round-trip on the thread pool)
+        logger.debug("Attempting to store screenshot in Anki media collection...")
+        self._store_media_in_background(
+            image_filename, image_out_path,
+            lambda res: self._on_screenshot_stored(res, image_filename, midpoint_sec)
+        )
 
-            # 7) Append multiple screenshots in the same field (self.field_image)
-            #    If you have a QLineEdit or QPlainTextEdit, do something like:
-            existing_value = self.field_image.text().strip()  # or self.field_image.toPlainText().strip()
-            print(f"[DEBUG] existing_value BEFORE appending: {repr(existing_value)}")
+    def _on_screenshot_stored(self, res, image_filename, midpoint_sec):
+        if res is None:
+            logger.debug("storeMediaFile returned None; unable to store in Anki.")
+            QMessageBox.warning(self, "Anki Error", "Could not store screenshot in Anki’s media collection.")
+            return
 
-            if existing_value:
-                updated_value = existing_value + " " + new_img_tag
-            else:
-                updated_value = new_img_tag
+        # 6) Build the <img src="filename.png"> tag
+        new_img_tag = f'<img src="{image_filename}">'
+        logger.debug("Created new img tag: %s", new_img_tag)
 
-            self.field_image.setText(updated_value)  # or setPlainText(updated_value)
-            print(f"[DEBUG] field_image updated_value: {repr(updated_value)}")
+        # 7) Append multiple screenshots in the same field (self.field_image)
+        existing_value = self.field_image.text().strip()
+        logger.debug("existing_value BEFORE appending: %r", existing_value)
 
-            QMessageBox.information(
-                self,
-                "Screenshot Captured",
-                f"Captured screenshot at ~{midpoint_sec:.2f} seconds."
-            )
+        if existing_value:
+            updated_value = existing_value + " " + new_img_tag
+        else:
+            updated_value = new_img_tag
 
-        except Exception as e:
-            print(f"[DEBUG] Exception during Anki storeMediaFile step: {e}")
-            QMessageBox.warning(self, "Anki Error", f"Error storing screenshot in Anki:\n{e}")
+        self.field_image.setText(updated_value)
+        logger.debug("field_image updated_value: %r", updated_value)
 
-        print("[DEBUG] Exiting capture_screenshot_placeholder normally.")
+        QMessageBox.information(
+            self,
+            "Screenshot Captured",
+            f"Captured screenshot at ~{midpoint_sec:.2f} seconds."
+        )
 
     # ------------------------------------------------------------------
     # Background Image Generation Queue
@@ -3156,7 +3791,8 @@ class SubtitleWindow(QDialog):
 
         word_text, dict_form_id = self._image_queue.pop(0)
         worker = ImageGenerationThread(word_text, dict_form_id,
-                                       self.openai_api_key, self.anki)
+                                       self.openai_api_key, self.anki,
+                                       session=self._http_session)
         worker.done.connect(self.on_image_generated)
         worker.error.connect(self.on_image_error)
         self._current_worker = worker
@@ -3164,6 +3800,9 @@ class SubtitleWindow(QDialog):
 
     def on_image_generated(self, dict_form_id: int, filename: str):
         """Handle successful image generation."""
+        worker = self._current_worker
+        if worker is not None and worker.image_data:
+            self._seed_thumbnail(filename, worker.image_data)
         new_tag = f'<img src="{filename}">' 
         existing = self.field_image.text().strip()
         updated = (existing + " " + new_tag).strip()
@@ -3192,7 +3831,7 @@ class SubtitleWindow(QDialog):
                                 "Cannot generate an image without a valid subtitle.")
             return
 
-        start_sec, end_sec, text = self._subtitle_lines[index]
+        text = self._subtitle_lines[index].text
         if not text.strip():
             QMessageBox.warning(self, "Empty Text",
                                 "The selected subtitle text is empty.")
@@ -3206,45 +3845,6 @@ class SubtitleWindow(QDialog):
             "Image generation has been queued and will run in the background."
         )
 
-        try:
-            prompt = f"Create a clear, literal illustration that shows the meaning of the subtitle: '{text}'."
-            response = openai.Image.create(
-                prompt=prompt,
-                n=1,
-                size="1024x1024",  # or "1024x1024",
-                model= "dall-e-3"  # Specify the DALL-E 3 model for HD
-            )
-            image_url = response["data"][0]["url"]
-        except Exception as e:
-            QMessageBox.warning(self, "OpenAI Error", f"Could not generate image:\n{e}")
-            return
-
-        # 4) Download the image data
-        try:
-            image_data = requests.get(image_url).content
-        except Exception as e:
-            QMessageBox.warning(self, "Network Error", f"Could not download image:\n{e}")
-            return
-
-        # 5) Store in Anki media
-        image_filename = f"ai_image_{uuid.uuid4().hex}.png"
-        b64_data = base64.b64encode(image_data).decode("utf-8")
-        res = self.anki.invoke("storeMediaFile", filename=image_filename, data=b64_data)
-        if res is None:
-            QMessageBox.warning(self, "Anki Error",
-                                "Could not store the image in Anki’s media collection.")
-            return
-
-        # 6) Append <img src=...> to self.field_image
-        new_img_tag = f'<img src="{image_filename}">'
-        existing_value = self.field_image.text().strip()
-        updated_value = (existing_value + " " + new_img_tag).strip()
-        self.field_image.setText(updated_value)
-
-        QMessageBox.information(self, "Image Generated",
-                                f"Created AI image for subtitle:\n{text}\n"
-                                f"File saved as: {image_filename}")
-
 
     def generate_word_image_async(self):
         """Generate an image for the word in ``field_native_word`` using the
@@ -3272,59 +3872,71 @@ class SubtitleWindow(QDialog):
                 base_word = info["base_form"]
 
         sentence = self.field_native_sentence.toPlainText().strip()
-        prompt_template = (
-            "Context:\n"
-            "Below is a sentence that uses the word \"[WORD]\":\n"
-            "\"[SENTENCE]\"\n\n"
-            "Character & Scene:\n"
-            "Akio – a young woman with ginger wavy hair, amber-hazel eyes, sun-kissed skin, and an athletic build – wearing a modern-meets-traditional Japanese outfit. She is energetic and expressive, captured mid-action as the central focus.\n\n"
-            "Task:\n"
-            "Illustrate the meaning of \"[WORD]\" through Akio’s actions, expression, and the scene around her, without any text or writing in the image. Use visual context and symbolism so that the viewer can infer the word’s sense from the image alone. If the concept of \"[WORD]\" is abstract or sensitive, portray it metaphorically in a positive, safe manner (no graphic or disallowed content).\n\n"
-            "Art Style & Lighting:\n\n"
-            "A blend of minimalist and detailed photorealistic elements with high-quality anime aesthetics\n\n"
-            "Soft two-tone anime-style shading and romantic natural lighting (warm sunset or gentle morning glow) to create an uplifting, joyful mood\n\n"
-            "2.5D perspective for depth and dimensionality\n\n"
-            "Consistency:\n"
-            "Ensure Akio remains consistent in appearance across images, and that the overall scene clearly symbolizes \"[WORD]\" at a glance."
-        )
+        prompt = _WORD_IMAGE_PROMPT.format(word=base_word, sentence=sentence)
 
-        prompt = (
-            prompt_template
-            .replace("[WORD]", base_word)
-            .replace("[word]", base_word)
-            .replace("[SENTENCE]", sentence)
-            .replace("[sentence]", sentence)
-        )
+        self._start_word_image_task(base_word, prompt, self.on_word_image_generated, self.on_word_image_error)
 
-        self._pending_word_image_word = base_word
-        self.word_image_worker = WordImageWorker(
-            self.openai_api_key,
-            prompt,
-            model="gpt-image-1",
+    def _start_word_image_task(self, word: str, prompt: str, on_finished, on_error) -> str:
+        """
+        Generate the image for (word, prompt) on the thread pool and return its
+        media filename. on_finished(word, image_filename, image_data) or
+        on_error(word, message) is called on the UI thread; a request for an
+        image that is already being generated waits on that task instead of
+        starting another.
+        """
+        image_filename = _word_image_filename(word, prompt)
+        waiters = self._word_image_inflight.get(image_filename)
+        if waiters is not None:
+            waiters.append((on_finished, on_error))
+            return image_filename
+        self._word_image_inflight[image_filename] = [(on_finished, on_error)]
+
+        task = ImageGenTask(word, prompt, self.openai_api_key, model="gpt-image-1",
+                            cache_path=self._word_image_cache_path(image_filename))
+
+        def finished(word, image_data):
+            self.word_image_workers.remove(task)
+            for on_finished, _ in self._word_image_inflight.pop(image_filename, ()):
+                on_finished(word, image_filename, image_data)
+
+        def failed(word, message):
+            self.word_image_workers.remove(task)
+            for _, on_error in self._word_image_inflight.pop(image_filename, ()):
+                on_error(word, message)
+
+        task.signals.finished.connect(finished)
+        task.signals.error.connect(failed)
+        self.word_image_workers.append(task)
+        self._image_gen_pool.start(task)
+        return image_filename
+
+    def _word_image_cache_path(self, image_filename: str) -> str:
+        """
+        Generated word images are kept in the media folder (the temp dir if
+        none is configured) under their content-keyed name (see
+        _word_image_filename), so that file is the cache. It is also what
+        storeMediaFile reads through path=.
+        """
+        return os.path.join(self.anki_media_path or tempfile.gettempdir(), image_filename)
+
+    def on_word_image_generated(self, word: str, image_filename: str, image_data: bytes):
+        """Handle the image bytes produced by the ``ImageGenTask``."""
+        # The task already wrote the file; Anki reads it from there
+        self._store_media_in_background(
+            image_filename, self._word_image_cache_path(image_filename),
+            lambda res: self._on_word_image_stored(res, image_filename, image_data, word)
         )
-        self.word_image_worker.finished.connect(self.on_word_image_generated)
-        self.word_image_worker.error.connect(self.on_word_image_error)
-        self.word_image_worker.start()
-
-    def on_word_image_generated(self, image_data: bytes):
-        """Handle the image bytes produced by ``WordImageWorker``."""
-        import base64
-        import uuid
-        from PyQt5.QtWidgets import QMessageBox
 
-        image_filename = f"word_image_{uuid.uuid4().hex}.png"
-        b64_data = base64.b64encode(image_data).decode("utf-8")
-        res = self.anki.invoke("storeMediaFile", filename=image_filename, data=b64_data)
+    def _on_word_image_stored(self, res, image_filename: str, image_data: bytes, word: str):
         if res is None:
             QMessageBox.warning(self, "Anki Error", "Could not store the image in Anki’s media collection.")
-        else:
-            new_tag = f'<img src="{image_filename}">' 
-            existing = self.field_image.text().strip()
-            updated = (existing + " " + new_tag).strip()
-            self.field_image.setText(updated)
-            QMessageBox.information(self, "Word Image Generated", f"Generated image for '{self._pending_word_image_word}'.")
-
-        self.word_image_worker = None
+            return
+        self._seed_thumbnail(image_filename, image_data)
+        new_tag = f'<img src="{image_filename}">'
+        existing = self.field_image.text().strip()
+        updated = (existing + " " + new_tag).strip()
+        self.field_image.setText(updated)
+        QMessageBox.information(self, "Word Image Generated", f"Generated image for '{word}'.")
 
 
     # ------------------------------------------------------------------
@@ -3332,12 +3944,16 @@ class SubtitleWindow(QDialog):
     # ------------------------------------------------------------------
     def populate_word_viewer(self, subtitle_text: str):
         """Fill the word viewer page with words from subtitle_text."""
+        # One layout pass and repaint for the whole rebuild
+        self.word_viewer_container.setUpdatesEnabled(False)
+        try:
+            self._fill_word_viewer(subtitle_text)
+        finally:
+            self.word_viewer_container.setUpdatesEnabled(True)
+
+    def _fill_word_viewer(self, subtitle_text: str):
         self.word_viewer_subtitle_label.setText(subtitle_text)
-        while self.word_viewer_layout.count():
-            item = self.word_viewer_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        self._hide_word_viewer_rows()
 
         self.selected_word_id = None
         self.selected_word_text = ""
@@ -3351,29 +3967,61 @@ class SubtitleWindow(QDialog):
         if not self.db_manager:
             return
 
-        forms = self.db_manager.get_surface_forms_for_text_content(subtitle_text)
+        forms = self._text_forms(subtitle_text)
         if not forms:
-            self.word_viewer_layout.addWidget(QLabel("No words found for this subtitle."))
+            if self._word_viewer_empty_label is None:
+                self._word_viewer_empty_label = QLabel("No words found for this subtitle.")
+                self.word_viewer_layout.addWidget(self._word_viewer_empty_label)
+            self._word_viewer_empty_label.show()
             return
 
-        for (sf_id, surface, df_id, base_form, known) in forms:
+        # Rows are pooled: widgets are only created when a subtitle has more
+        # words than any subtitle shown before, otherwise they are re-labelled.
+        self._word_row_surfaces = [(df_id, surface) for (_, surface, df_id, _, _) in forms]
+        for i, (sf_id, surface, df_id, base_form, known) in enumerate(forms):
             self.word_viewer_dict_form_surfaces[df_id] = surface
-            cont = QWidget()
-            vbox = QVBoxLayout(cont)
-
-            lbl_word = ClickableWordLabel(surface, df_id)
-            base_lbl = QLabel(f"({base_form})")
-            cb = QCheckBox()
-
-            lbl_word.clicked.connect(lambda w=surface, d=df_id, l=lbl_word: self.on_word_label_clicked(w, d, l))
-            cb.stateChanged.connect(lambda state, d=df_id, s=surface: self.on_word_viewer_checkbox_changed(d, s, state))
-
-            vbox.addWidget(lbl_word, alignment=Qt.AlignCenter)
-            vbox.addWidget(base_lbl, alignment=Qt.AlignCenter)
-            vbox.addWidget(cb, alignment=Qt.AlignHCenter)
+            if i == len(self._word_row_pool):
+                self._word_row_pool.append(self._create_word_viewer_row(i))
+            cont, lbl_word, base_lbl, cb = self._word_row_pool[i]
+            lbl_word.setText(surface)
+            lbl_word.word_text = surface
+            lbl_word.dict_form_id = df_id
+            base_lbl.setText(f"({base_form})")
+            cont.show()
+        self._word_row_active = len(forms)
+
+    def _create_word_viewer_row(self, index: int):
+        cont = QWidget()
+        vbox = QVBoxLayout(cont)
+
+        lbl_word = ClickableWordLabel("", 0)
+        base_lbl = QLabel()
+        cb = QCheckBox()
+
+        # The label carries its current word; the checkbox looks its word up by row
+        lbl_word.clicked.connect(lambda w, d, l=lbl_word: self.on_word_label_clicked(w, d, l))
+        cb.stateChanged.connect(
+            lambda state, i=index: self.on_word_viewer_checkbox_changed(*self._word_row_surfaces[i], state)
+        )
 
-            cont.setLayout(vbox)
-            self.word_viewer_layout.addWidget(cont)
+        vbox.addWidget(lbl_word, alignment=Qt.AlignCenter)
+        vbox.addWidget(base_lbl, alignment=Qt.AlignCenter)
+        vbox.addWidget(cb, alignment=Qt.AlignHCenter)
+        self.word_viewer_layout.addWidget(cont)
+        return cont, lbl_word, base_lbl, cb
+
+    def _hide_word_viewer_rows(self):
+        # Hide (rather than delete) the rows shown last time; _fill_word_viewer reuses them
+        for cont, lbl_word, base_lbl, cb in self._word_row_pool[:self._word_row_active]:
+            cont.hide()
+            lbl_word.setStyleSheet("")
+            cb.blockSignals(True)
+            cb.setChecked(False)
+            cb.blockSignals(False)
+        self._word_row_active = 0
+        self._word_row_surfaces = []
+        if self._word_viewer_empty_label is not None:
+            self._word_viewer_empty_label.hide()
 
     def on_word_label_clicked(self, word_text: str, dict_form_id: int, label: QLabel):
         if self.selected_word_label is not None:
@@ -3408,29 +4056,7 @@ class SubtitleWindow(QDialog):
             return
 
         sentence = self.word_viewer_subtitle_label.text().strip()
-        prompt_template = (
-            "Context:\n"
-            "Below is a sentence that uses the word \"[WORD]\":\n"
-            "\"[SENTENCE]\"\n\n"
-            "Character & Scene:\n"
-            "Akio – a young woman with ginger wavy hair, amber-hazel eyes, sun-kissed skin, and an athletic build – wearing a modern-meets-traditional Japanese outfit. She is energetic and expressive, captured mid-action as the central focus.\n\n"
-            "Task:\n"
-            "Illustrate the meaning of \"[WORD]\" through Akio’s actions, expression, and the scene around her, without any text or writing in the image. Use visual context and symbolism so that the viewer can infer the word’s sense from the image alone. If the concept of \"[WORD]\" is abstract or sensitive, portray it metaphorically in a positive, safe manner (no graphic or disallowed content).\n\n"
-            "Art Style & Lighting:\n\n"
-            "A blend of minimalist and detailed photorealistic elements with high-quality anime aesthetics\n\n"
-            "Soft two-tone anime-style shading and romantic natural lighting (warm sunset or gentle morning glow) to create an uplifting, joyful mood\n\n"
-            "2.5D perspective for depth and dimensionality\n\n"
-            "Consistency:\n"
-            "Ensure Akio remains consistent in appearance across images, and that the overall scene clearly symbolizes \"[WORD]\" at a glance."
-        )
-
-        prompt = (
-            prompt_template
-            .replace("[WORD]", word_text)
-            .replace("[word]", word_text)
-            .replace("[SENTENCE]", sentence)
-            .replace("[sentence]", sentence)
-        )
+        prompt = _WORD_IMAGE_PROMPT.format(word=word_text, sentence=sentence)
 
         tab = QWidget()
         vbox = QVBoxLayout(tab)
@@ -3440,26 +4066,22 @@ class SubtitleWindow(QDialog):
         self.image_tab_widget.addTab(tab, word_text)
         self.image_tab_widget.setCurrentWidget(tab)
 
-        # use the GPT-Image-1 model
-        worker = WordImageWorker(self.openai_api_key, prompt, model="gpt-image-1")
-        self.word_image_workers.append(worker)
-
-        def handle_finished(image_data, *, w=worker, label=lbl, word=word_text):
+        def handle_finished(word, image_filename, image_data, *, label=lbl):
             from PyQt5.QtGui import QPixmap
-            import uuid, base64
 
-            image_filename = f"word_image_{uuid.uuid4().hex}.png"
-            b64_data = base64.b64encode(image_data).decode("utf-8")
-            res = self.anki.invoke("storeMediaFile", filename=image_filename, data=b64_data)
-            if res is None:
-                QMessageBox.warning(self, "Anki Error", "Could not store the image in Anki’s media collection.")
-            else:
+            def stored(res):
+                if res is None:
+                    QMessageBox.warning(self, "Anki Error", "Could not store the image in Anki’s media collection.")
+                    return
                 new_tag = f'<img src="{image_filename}">'
                 existing = self.field_image.text().strip()
                 updated = (existing + " " + new_tag).strip()
                 self.field_image.setText(updated)
                 self.word_image_files_map.setdefault(word, []).append(image_filename)
 
+            # The task already wrote the file; Anki reads it from there
+            self._store_media_in_background(image_filename, self._word_image_cache_path(image_filename), stored)
+
             pix = QPixmap()
             pix.loadFromData(image_data)
             if not pix.isNull():
@@ -3474,24 +4096,17 @@ class SubtitleWindow(QDialog):
             else:
                 label.setText("Invalid image data")
 
-            if w in self.word_image_workers:
-                self.word_image_workers.remove(w)
             QMessageBox.information(self, "Word Image Generated", f"Generated image for '{word}'.")
 
-        def handle_error(message, *, w=worker, label=lbl):
+        def handle_error(word, message, *, label=lbl):
             label.setText("Error generating image")
             QMessageBox.warning(self, "Image Generation Failed", message)
-            if w in self.word_image_workers:
-                self.word_image_workers.remove(w)
 
-        worker.finished.connect(handle_finished)
-        worker.error.connect(handle_error)
-        worker.start()
+        self._start_word_image_task(word_text, prompt, handle_finished, handle_error)
 
-    def on_word_image_error(self, message: str):
+    def on_word_image_error(self, word: str, message: str):
         from PyQt5.QtWidgets import QMessageBox
         QMessageBox.warning(self, "Image Generation Failed", message)
-        self.word_image_worker = None
 
     def close_image_tab(self, index: int):
         """Close and delete the image tab at ``index``."""
@@ -3512,14 +4127,14 @@ class SubtitleWindow(QDialog):
 
         selected_surfaces = []
         pos_list = []
+        info_map = self._dict_form_infos(self.word_viewer_selected_dict_form_ids) if self.db_manager else {}
         for df_id in self.word_viewer_selected_dict_form_ids:
             surf = self.word_viewer_selected_dict_form_surfaces.get(df_id, "")
             if surf:
                 selected_surfaces.append(surf)
-            if self.db_manager:
-                info = self.db_manager.get_dict_form_info(df_id)
-                if info:
-                    pos_list.append(info.get("pos", ""))
+            info = info_map.get(df_id)
+            if info:
+                pos_list.append(info.get("pos", ""))
 
         native_word_str = ", ".join(selected_surfaces)
         pos_value = ", ".join(pos_list)
@@ -3548,7 +4163,10 @@ class SubtitleWindow(QDialog):
             "deck_name": "Words",
         }
 
-        self.insert_single_card_into_db_and_anki(card_data, "Words")
-        QMessageBox.information(self, "Card Created", "Created a card from the Word Viewer selection.")
+        def add_with_tokens(tokens):
+            self.insert_single_card_into_db_and_anki(card_data, "Words", tokens=tokens)
+            QMessageBox.information(self, "Card Created", "Created a card from the Word Viewer selection.")
+
+        self._with_tokens(native_sentence_str, add_with_tokens)
 
 
@@ -1,5 +1,8 @@
 import os
-import re
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, chain
 from typing import List, Dict
 
 class Subtitle:
@@ -11,12 +14,26 @@ class Subtitle:
 
 class SubtitleManager:
     def __init__(self):
-        self.subtitles = []
+        # Cues are stored column-wise, sorted by start time: one float per
+        # start/end in compact arrays instead of one dict per cue.
+        self._starts = array('d')
+        self._ends = array('d')
+        self._max_ends = array('d')  # running max of _ends; finds the earliest cue still open
+        self._texts = []
+        self._last_index = -1
 
-    def load_subtitles(self, file_path):
-        if file_path.endswith('.srt'):
+    def load_subtitles(self, file_path, fmt=None):
+        """
+        file_path may also be an open text stream (e.g. a response body); its
+        format then comes from fmt ('srt'/'vtt') or the stream's name.
+        """
+        if isinstance(file_path, str):
+            name = file_path
+        else:
+            name = '.' + fmt if fmt else getattr(file_path, 'name', '')
+        if name.endswith('.srt'):
             return self._load_srt(file_path)
-        elif file_path.endswith('.vtt'):
+        elif name.endswith('.vtt'):
             return self._load_vtt(file_path)
         else:
             return False
@@ -25,53 +42,107 @@ class SubtitleManager:
         return self.load_subtitles(file_path)
 
     def _load_srt(self, file_path):
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+        return self._load_cues(file_path, ',')
 
-        pattern = re.compile(r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n(.*?)\n\n', re.DOTALL)
-        matches = pattern.findall(content)
+    def _load_vtt(self, file_path):
+        return self._load_cues(file_path, '.')
 
-        self.subtitles = []
-        for match in matches:
-            index, start_time, end_time, text = match
-            start_seconds = self._convert_time_to_seconds(start_time)
-            end_seconds = self._convert_time_to_seconds(end_time)
-            self.subtitles.append({
-                'start_time': start_seconds,
-                'end_time': end_seconds,
-                'text': text.replace('\n', ' ')
-            })
+    def _load_cues(self, file_path, ms_sep):
+        # Lines are consumed as they are read; the whole file is never held as one string
+        if isinstance(file_path, str):
+            with open(file_path, 'r', encoding='utf-8') as file:
+                self._set_subtitles(self._parse_cues(file, ms_sep))
+        else:
+            self._set_subtitles(self._parse_cues(file_path, ms_sep))
         return True
 
-    def _load_vtt(self, file_path):
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+    def _set_subtitles(self, cues):
+        starts, ends, texts = cues
+        if any(starts[i] > starts[i + 1] for i in range(len(starts) - 1)):
+            order = sorted(range(len(starts)), key=starts.__getitem__)
+            starts = [starts[i] for i in order]
+            ends = [ends[i] for i in order]
+            texts = [texts[i] for i in order]
+        self._starts = array('d', starts)
+        self._ends = array('d', ends)
+        self._max_ends = array('d', accumulate(ends, max))
+        self._texts = texts
+        self._last_index = -1
 
-        pattern = re.compile(r'(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})\n(.*?)\n\n', re.DOTALL)
-        matches = pattern.findall(content)
+    def _parse_cues(self, lines, ms_sep):
+        """
+        Scan SRT/WebVTT cues line by line: a 'start --> end' timing line opens
+        a cue and the lines up to the next blank line are its text, joined with
+        spaces. Everything else (cue numbers, the WEBVTT header, NOTE blocks)
+        is skipped. ms_sep is the character before the milliseconds.
+        Returns parallel (starts, ends, texts) lists in file order.
+        """
+        starts, ends, texts = [], [], []
+        # One str object per distinct cue text: short ones ("[音楽]", "…") are
+        # interned, longer repeats share the first copy seen in this file.
+        dedupe = {}
+        times = None  # (start, end) of the cue whose text is being collected
+        text_buf = []
+        for line in chain(lines, ('',)):  # the trailing '' ends the last cue
+            line = line.rstrip('\r\n')
+            if times is None:
+                times = self._parse_cue_times(line, ms_sep)
+            elif line:
+                text_buf.append(line)
+            else:
+                if text_buf:
+                    text = ' '.join(text_buf)
+                    text = sys.intern(text) if len(text) < 64 else dedupe.setdefault(text, text)
+                    starts.append(times[0])
+                    ends.append(times[1])
+                    texts.append(text)
+                times = None
+                text_buf = []
+        return starts, ends, texts
 
-        self.subtitles = []
-        for match in matches:
-            start_time, end_time, text = match
-            start_seconds = self._convert_time_to_seconds(start_time.replace('.', ','))
-            end_seconds = self._convert_time_to_seconds(end_time.replace('.', ','))
-            self.subtitles.append({
-                'start_time': start_seconds,
-                'end_time': end_seconds,
-                'text': text.replace('\n', ' ')
-            })
-        return True
+    def _parse_cue_times(self, line, ms_sep):
+        """(start, end) in seconds for a 'HH:MM:SS,mmm --> HH:MM:SS,mmm' line, else None."""
+        arrow = line.find(' --> ')
+        if arrow != 12:
+            return None
+        start = line[:12]
+        end = line[17:29]  # WebVTT cue settings may follow the end time
+        if not (self._is_timestamp(start, ms_sep) and self._is_timestamp(end, ms_sep)):
+            return None
+        # Fields sit at fixed offsets once validated, so slice them directly
+        return (
+            int(start[0:2]) * 3600 + int(start[3:5]) * 60 + int(start[6:8]) + int(start[9:12]) / 1000,
+            int(end[0:2]) * 3600 + int(end[3:5]) * 60 + int(end[6:8]) + int(end[9:12]) / 1000,
+        )
 
-    def _convert_time_to_seconds(self, time_str):
-        h, m, s = time_str.split(':')
-        s, ms = s.split(',')
-        return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000
+    @staticmethod
+    def _is_timestamp(t, ms_sep):
+        if len(t) != 12 or t[2] != ':' or t[5] != ':' or t[8] != ms_sep:
+            return False
+        digits = t[0:2] + t[3:5] + t[6:8] + t[9:12]
+        return digits.isascii() and digits.isdigit()
 
-    def get_subtitles(self):
-        return self.subtitles
+    def get_subtitles(self) -> List[Dict]:
+        """The cues as {'start_time', 'end_time', 'text'} dicts, built on each call."""
+        return [
+            {'start_time': start, 'end_time': end, 'text': text}
+            for start, end, text in zip(self._starts, self._ends, self._texts)
+        ]
 
     def get_current_subtitle(self, current_time):
-        for subtitle in self.subtitles:
-            if subtitle['start_time'] <= current_time <= subtitle['end_time']:
-                return subtitle['text']
+        """
+        Text of the earliest-starting cue with start <= current_time <= end, or ''.
+        Cues may overlap, so the cue starting last before current_time is not
+        necessarily the answer; _max_ends locates the first cue still open.
+        """
+        # Playback usually asks for the same cue many frames in a row
+        i = self._last_index
+        if (i >= 0 and self._starts[i] <= current_time <= self._ends[i]
+                and (i == 0 or self._max_ends[i - 1] < current_time)):
+            return self._texts[i]
+        # First cue whose end (equivalently, running max end) reaches current_time
+        i = bisect_left(self._max_ends, current_time)
+        if i < len(self._texts) and self._starts[i] <= current_time:
+            self._last_index = i
+            return self._texts[i]
         return ""
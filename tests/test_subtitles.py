@@ -0,0 +1,104 @@
+import io
+import os
+import tempfile
+import unittest
+from subtitles import SubtitleManager
+
+SRT = """1
+00:00:01,000 --> 00:00:02,500
+こんにちは
+
+2
+00:00:03,000 --> 00:00:04,000
+二行の
+字幕
+
+"""
+
+VTT = """WEBVTT
+
+00:00:01.000 --> 00:00:02.500
+こんにちは
+
+00:00:03.000 --> 00:00:04.000
+二行の
+字幕
+
+"""
+
+class TestSubtitleManager(unittest.TestCase):
+    def _load(self, content, suffix):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        manager = SubtitleManager()
+        self.assertTrue(manager.load_subtitles(path))
+        return manager
+
+    def test_srt(self):
+        manager = self._load(SRT, '.srt')
+        self.assertEqual(manager.get_subtitles(), [
+            {'start_time': 1.0, 'end_time': 2.5, 'text': 'こんにちは'},
+            {'start_time': 3.0, 'end_time': 4.0, 'text': '二行の 字幕'},
+        ])
+
+    def test_vtt(self):
+        manager = self._load(VTT, '.vtt')
+        self.assertEqual(manager.get_subtitles(), [
+            {'start_time': 1.0, 'end_time': 2.5, 'text': 'こんにちは'},
+            {'start_time': 3.0, 'end_time': 4.0, 'text': '二行の 字幕'},
+        ])
+
+    def test_vtt_settings_and_no_trailing_blank(self):
+        content = "WEBVTT\n\nNOTE comment\n\n00:00:01.000 --> 00:00:02.500 align:start\nこんにちは"
+        manager = self._load(content, '.vtt')
+        self.assertEqual(manager.get_subtitles(), [
+            {'start_time': 1.0, 'end_time': 2.5, 'text': 'こんにちは'},
+        ])
+
+    def test_stream(self):
+        manager = SubtitleManager()
+        self.assertTrue(manager.load_subtitles(io.StringIO(VTT), fmt='vtt'))
+        self.assertEqual(len(manager.get_subtitles()), 2)
+        self.assertFalse(manager.load_subtitles(io.StringIO(VTT)))
+
+    def test_unknown_extension(self):
+        self.assertFalse(SubtitleManager().load_subtitles('episode.ass'))
+
+    def test_current_subtitle(self):
+        manager = self._load(SRT, '.srt')
+        self.assertEqual(manager.get_current_subtitle(1.5), 'こんにちは')
+        self.assertEqual(manager.get_current_subtitle(2.7), '')
+        self.assertEqual(manager.get_current_subtitle(4.0), '二行の 字幕')
+
+    def test_repeated_texts_shared(self):
+        long_text = "長い" * 40
+        content = "".join(
+            f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\n{text}\n\n"
+            for i, text in enumerate(["[音楽]", long_text, "[音楽]", long_text], start=1)
+        )
+        texts = [sub['text'] for sub in self._load(content, '.srt').get_subtitles()]
+        self.assertIs(texts[0], texts[2])
+        self.assertIs(texts[1], texts[3])
+
+    def test_current_subtitle_overlapping(self):
+        content = ("1\n00:00:01,000 --> 00:00:10,000\nA\n\n"
+                   "2\n00:00:02,000 --> 00:00:03,000\nB\n\n"
+                   "3\n00:00:12,000 --> 00:00:13,000\nC\n\n")
+        manager = self._load(content, '.srt')
+        self.assertEqual(manager.get_current_subtitle(2.5), 'A')
+        self.assertEqual(manager.get_current_subtitle(5.0), 'A')
+        self.assertEqual(manager.get_current_subtitle(11.0), '')
+        self.assertEqual(manager.get_current_subtitle(12.5), 'C')
+        self.assertEqual(manager.get_current_subtitle(2.5), 'A')
+
+    def test_current_subtitle_unordered(self):
+        content = "2\n00:00:03,000 --> 00:00:04,000\nB\n\n1\n00:00:01,000 --> 00:00:02,000\nA\n\n"
+        manager = self._load(content, '.srt')
+        self.assertEqual(manager.get_current_subtitle(1.0), 'A')
+        self.assertEqual(manager.get_current_subtitle(3.5), 'B')
+        self.assertEqual(manager.get_current_subtitle(0.5), '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,8 +3,73 @@ from PyQt5.QtWidgets import (
     QLabel, QGroupBox, QGridLayout, QStatusBar, QTableView, QComboBox, QLineEdit,
     QHeaderView, QFrame, QSpacerItem, QSizePolicy
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QStandardItemModel, QStandardItem
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QTimer
+import re
+
+# Column positions in WordTableModel rows
+_COL_LEMMA, _COL_READING, _COL_KNOWN, _COL_TAGS = 1, 2, 4, 5
+
+# tag_filter_combo entry -> tag stored in the Tags column
+_TAG_FILTERS = {
+    "Tag: Known": "known",
+    "Tag: High Frequency": "high_frequency",
+    "Tag: Custom": "custom",
+}
+
+
+class WordTableModel(QAbstractTableModel):
+    """Read-only table over a list of row tuples; cells are only formatted when the view asks."""
+
+    def __init__(self, rows, headers, parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        self._headers = headers
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self._rows[index.row()][index.column()])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    def row(self, row):
+        return self._rows[row]
+
+
+class WordFilterProxyModel(QSortFilterProxyModel):
+    """Filters WordTableModel rows by known state, tag and a lemma/reading search."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._known = None  # True/False to keep only known/unknown words, None for all
+        self._tag = None
+        self._search_re = None  # compiled once per filter change, not per row
+
+    def set_filter(self, known, tag, search_text):
+        self._known = known
+        self._tag = tag
+        self._search_re = re.compile(re.escape(search_text), re.I) if search_text else None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        row = self.sourceModel().row(source_row)
+        if self._known is not None and (row[_COL_KNOWN] == "Yes") != self._known:
+            return False
+        if self._tag is not None and self._tag not in row[_COL_TAGS].split(";"):
+            return False
+        if self._search_re is not None:
+            return bool(self._search_re.search(row[_COL_LEMMA]) or self._search_re.search(row[_COL_READING]))
+        return True
+
 
 class WordExplorerWindow(QMainWindow):
     def __init__(self, db_manager, parent=None):
@@ -37,7 +102,12 @@ class WordExplorerWindow(QMainWindow):
         # Line edit for searching words
         self.search_line = QLineEdit()
         self.search_line.setPlaceholderText("Search by lemma or reading...")
-        self.search_line.textChanged.connect(self.update_filter)
+        # Typing restarts the timer, so the filter runs once the user pauses for 200 ms
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self.update_filter)
+        self.search_line.textChanged.connect(lambda _text: self._filter_timer.start())
 
         filter_layout.addWidget(QLabel("View:"))
         filter_layout.addWidget(self.view_mode_combo)
@@ -56,23 +126,21 @@ class WordExplorerWindow(QMainWindow):
         self.table_view.setSelectionBehavior(QTableView.SelectRows)
         self.table_view.setAlternatingRowColors(True)
 
-        # Set up a dummy model for now. In real code, populate from DB.
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(["Word ID", "Lemma", "Reading", "POS", "Known", "Tags", "Card ID"])
-
         # Insert dummy data (in real scenario, load from DB)
         dummy_data = [
-            [1, "猫", "ねこ", "Noun", "Yes", "known;N5", 1001],
-            [2, "犬", "いぬ", "Noun", "No", "N5", 1002],
-            [3, "走る", "はしる", "Verb", "No", "high_frequency", 1003],
-            [4, "食べる", "たべる", "Verb", "Yes", "known;high_frequency", 1004]
+            (1, "猫", "ねこ", "Noun", "Yes", "known;N5", 1001),
+            (2, "犬", "いぬ", "Noun", "No", "N5", 1002),
+            (3, "走る", "はしる", "Verb", "No", "high_frequency", 1003),
+            (4, "食べる", "たべる", "Verb", "Yes", "known;high_frequency", 1004)
         ]
 
-        for row_data in dummy_data:
-            row_items = [QStandardItem(str(x)) for x in row_data]
-            self.model.appendRow(row_items)
-
-        self.table_view.setModel(self.model)
+        # The view pulls cells from the row tuples on demand; filtering goes through the proxy
+        self.model = WordTableModel(
+            dummy_data, ["Word ID", "Lemma", "Reading", "POS", "Known", "Tags", "Card ID"]
+        )
+        self.proxy_model = WordFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.table_view.setModel(self.proxy_model)
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
         main_layout.addWidget(self.table_view)
@@ -105,8 +173,11 @@ class WordExplorerWindow(QMainWindow):
         self.status_bar.showMessage("Ready")
 
     def update_filter(self):
-        # Dummy filter method
-        self.status_bar.showMessage("Filter updated (dummy).")
+        self._filter_timer.stop()  # a combo change applies any pending search text too
+        known = {1: True, 2: False}.get(self.view_mode_combo.currentIndex())
+        tag = _TAG_FILTERS.get(self.tag_filter_combo.currentText())
+        self.proxy_model.set_filter(known, tag, self.search_line.text().strip())
+        self.status_bar.showMessage(f"{self.proxy_model.rowCount()} words shown.")
 
     def explore_new_words(self):
         sentence_data = self.db_manager.get_random_sentence()
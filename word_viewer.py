@@ -11,7 +11,8 @@ class WordViewerWindow(QDialog):
         self.layout = QVBoxLayout(self)
         self.word_list = QListWidget(self)
         self.layout.addWidget(self.word_list)
-        self.thread_pool = QThreadPool()
+        # Shared with the rest of the app (sized in main()); one pool per viewer would oversubscribe
+        self.thread_pool = QThreadPool.globalInstance()
         self.word_items = {}  # key: (word, subtitle), value: QListWidgetItem
 
     def add_words(self, words, subtitle, media_id, timestamp):